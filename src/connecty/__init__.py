@@ -37,7 +37,7 @@ Example usage (Bolts):
 """
 
 from .common import Load
-from .bolt import BoltConnection, BoltGroup, BoltLayout, BoltParams, BoltForceResult, LoadedBoltConnection, Plate
+from .bolt import BoltConnection, BoltGroup, BoltLayout, BoltParams, BoltForceArray, BoltForceResult, LoadedBoltConnection, Plate
 from .weld import WeldBaseMetal, WeldConnection, WeldParams, WeldResult
 from .weld.checks import WeldCheckDetail, WeldCheckResult
 
@@ -48,6 +48,7 @@ __all__ = [
     "BoltGroup",
     "BoltParams",
     "BoltForceResult",
+    "BoltForceArray",
     "LoadedBoltConnection",
     "BoltConnection",
     "Plate",
@@ -1,5 +1,5 @@
 from .bolt import BoltConnection, BoltGroup, BoltParams, Bolt
-from .analysis import LoadedBoltConnection, BoltForceResult
+from .analysis import LoadedBoltConnection, BoltForceArray, BoltForceResult
 from .layout import BoltLayout
 from .plate import Plate
 from . import layout
@@ -12,6 +12,7 @@ __all__ = [
     "Bolt",
     "BoltLayout",
     "BoltForceResult",
+    "BoltForceArray",
     "LoadedBoltConnection",
     "Plate",
     "layout",
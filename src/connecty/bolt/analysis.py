@@ -1,11 +1,16 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Literal, Any, TYPE_CHECKING
+import math
+import operator
 
 import numpy as np
 
 from .bolt import BoltConnection
+from .solvers.elastic import solve_bolt_elastic
+from .solvers.icr import solve_bolt_icr
 
 if TYPE_CHECKING:
     from ..common.load import Load
@@ -13,7 +18,11 @@ if TYPE_CHECKING:
 
 @dataclass(frozen=True)
 class BoltForceResult:
-    """Force result for a single bolt."""
+    """Force result for a single bolt.
+
+    The result is frozen, so derived quantities are computed on first access
+    and cached.
+    """
 
     Fx: float  # tension (out-of-plane)
     Fy: float  # shear in y
@@ -21,11 +30,11 @@ class BoltForceResult:
     area: float
     n_shear_planes: int
 
-    @property
+    @cached_property
     def shear(self) -> float:
-        return float(np.sqrt(self.Fy**2 + self.Fz**2))
+        return math.hypot(self.Fy, self.Fz)
 
-    @property
+    @cached_property
     def shear_stress(self) -> float:
         return self.shear / (self.area * self.n_shear_planes)
 
@@ -34,6 +43,67 @@ class BoltForceResult:
         return self.Fx / self.area
 
 
+@dataclass(frozen=True, eq=False)
+class BoltForceArray:
+    """Force results for all bolts as parallel arrays, one entry per bolt.
+
+    Derived quantities are computed over the whole group at once; indexing
+    returns the equivalent `BoltForceResult` for a single bolt. The arrays
+    are read-only views of the analysis results.
+    """
+
+    points: np.ndarray  # (N, 2) of (y, z)
+    Fx: np.ndarray  # tension (out-of-plane)
+    Fy: np.ndarray  # shear in y
+    Fz: np.ndarray  # shear in z
+    area: np.ndarray
+    n_shear_planes: int
+
+    def __len__(self) -> int:
+        return len(self.Fx)
+
+    def __getitem__(self, i: int | slice | np.ndarray) -> BoltForceResult | BoltForceArray:
+        """One bolt's `BoltForceResult` for an integer index, otherwise the
+        sub-array selected by a slice, index array or mask."""
+        try:
+            i = operator.index(i)
+        except TypeError:
+            return BoltForceArray(
+                points=_readonly(self.points[i]),
+                Fx=_readonly(self.Fx[i]),
+                Fy=_readonly(self.Fy[i]),
+                Fz=_readonly(self.Fz[i]),
+                area=_readonly(self.area[i]),
+                n_shear_planes=self.n_shear_planes,
+            )
+        return BoltForceResult(
+            Fx=float(self.Fx[i]),
+            Fy=float(self.Fy[i]),
+            Fz=float(self.Fz[i]),
+            area=float(self.area[i]),
+            n_shear_planes=self.n_shear_planes,
+        )
+
+    @cached_property
+    def shear(self) -> np.ndarray:
+        return _readonly(np.hypot(self.Fy, self.Fz))
+
+    @cached_property
+    def shear_stress(self) -> np.ndarray:
+        return _readonly(self.shear / (self.area * self.n_shear_planes))
+
+    @property
+    def tension_stress(self) -> np.ndarray:
+        return _readonly(self.Fx / self.area)
+
+
+def _readonly(arr: np.ndarray) -> np.ndarray:
+    """Non-writeable view of `arr` (the owner keeps write access)."""
+    view = arr.view()
+    view.flags.writeable = False
+    return view
+
+
 def _solve_tension_conservative(
     bolt_coords: np.ndarray,
     bolt_ks: np.ndarray,
@@ -136,16 +206,15 @@ class LoadedBoltConnection:
     _fxs: np.ndarray = field(init=False, repr=False)
     _fys: np.ndarray = field(init=False, repr=False)
     _fzs: np.ndarray = field(init=False, repr=False)
+    load_at_centroid: "Load" = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
         """Calculate and distribute forces to all bolts in the connection."""
-        bolt_coords = np.array(self.bolt_connection.bolt_group.points)  # (y, z)
+        bolt_coords = self.bolt_connection.bolt_group.points_array  # (y, z)
 
         # --- Shear Distribution (in-plane: Fy, Fz) ---
         # Solvers use generic (coord1, coord2); we pass (y, z).
         if self.shear_method == "elastic":
-            from .solvers.elastic import solve_bolt_elastic
-
             fys, fzs = solve_bolt_elastic(
                 bolt_coords=bolt_coords,
                 Fx=self.load.Fy,       # shear in y (solver's first coord)
@@ -155,8 +224,6 @@ class LoadedBoltConnection:
                 y_loc=self.load.z_loc,
             )
         elif self.shear_method == "icr":
-            from .solvers.icr import solve_bolt_icr
-
             fys, fzs, icr = solve_bolt_icr(
                 bolt_coords=bolt_coords,
                 Fx=self.load.Fy,
@@ -170,12 +237,13 @@ class LoadedBoltConnection:
             raise ValueError(f"Unknown shear method: {self.shear_method}")
 
         # --- Tension Distribution (out-of-plane: Fx) ---
-        bolt_ks = np.array([b.k for b in self.bolt_connection.bolt_group.bolts], dtype=float)
+        bolt_ks = self.bolt_connection.bolt_ks
         plate = self.bolt_connection.plate
 
         # Transfer moments to bolt group centroid to account for eccentric load
         bg = self.bolt_connection.bolt_group
         load_at_centroid = self.load.equivalent_at((0.0, bg.Cy, bg.Cz))
+        self.load_at_centroid = load_at_centroid
 
         if self.tension_method == "conservative":
             fxs = _solve_tension_conservative(
@@ -218,18 +286,37 @@ class LoadedBoltConnection:
 
     def to_bolt_forces(self) -> list[BoltForceResult]:
         """Per-bolt force results with derived quantities."""
-        n_sp = self.bolt_connection.n_shear_planes
-        bolts = self.bolt_connection.bolt_group.bolts
-        return [
-            BoltForceResult(
-                Fx=float(self._fxs[i]),
-                Fy=float(self._fys[i]),
-                Fz=float(self._fzs[i]),
-                area=bolts[i].params.area,
-                n_shear_planes=n_sp,
-            )
-            for i in range(len(bolts))
-        ]
+        forces = self.to_bolt_force_array()
+        return [forces[i] for i in range(len(forces))]
+
+    def to_bolt_force_array(self) -> BoltForceArray:
+        """Force results for all bolts as parallel arrays."""
+        bolt_group = self.bolt_connection.bolt_group
+        area = np.fromiter((b.params.area for b in bolt_group.bolts), dtype=float, count=bolt_group.n)
+        return BoltForceArray(
+            points=_readonly(bolt_group.points_array),
+            Fx=_readonly(self._fxs),
+            Fy=_readonly(self._fys),
+            Fz=_readonly(self._fzs),
+            area=_readonly(area),
+            n_shear_planes=self.bolt_connection.n_shear_planes,
+        )
+
+    def to_bolt_forces_soa(self) -> dict[str, np.ndarray]:
+        """Per-bolt positions and forces as parallel read-only arrays.
+
+        Keys: 'y', 'z', 'Fx', 'Fy', 'Fz', 'shear'. A dict view of
+        `to_bolt_force_array`.
+        """
+        forces = self.to_bolt_force_array()
+        return {
+            "y": forces.points[:, 0],
+            "z": forces.points[:, 1],
+            "Fx": forces.Fx,
+            "Fy": forces.Fy,
+            "Fz": forces.Fz,
+            "shear": forces.shear,
+        }
 
     def check(self, standard: str, **kwargs: Any) -> dict[str, Any]:
         if standard.lower() == "aisc":
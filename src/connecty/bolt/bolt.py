@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import copy
 from dataclasses import dataclass, field
-from typing import Optional, TYPE_CHECKING
+from typing import Optional, Sequence, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..common.load import Load
@@ -10,6 +10,8 @@ if TYPE_CHECKING:
 
 from .plate import Plate
 from .layout import BoltLayout
+from .solvers.elastic import solve_bolt_elastic_batch
+from .solvers.icr import solve_bolt_icr_batch
 import numpy as np
 
 
@@ -39,6 +41,9 @@ AISC_PRETENSION_KN: dict[int, dict[str, float]] = {
     36: {"A325": 475.0, "A490": 595.0},
 }
 
+# Bound on first BoltConnection.analyze call (analysis imports this module).
+_LoadedBoltConnection: type[LoadedBoltConnection] | None = None
+
 
 
 
@@ -123,15 +128,22 @@ class BoltGroup:
 
     bolts: list[Bolt]
     centroid: tuple[float, float] = field(init=False)
+    points_array: np.ndarray = field(init=False, repr=False, compare=False)
+    _Ip: float = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         if not self.bolts:
             raise ValueError("BoltGroup must contain at least one bolt")
 
-        cy = sum(b.position[0] for b in self.bolts) / len(self.bolts)
-        cz = sum(b.position[1] for b in self.bolts) / len(self.bolts)
+        # Contiguous (N, 2) copy of the (y, z) positions for vectorized consumers.
+        self.points_array = np.ascontiguousarray([b.position for b in self.bolts], dtype=np.float64)
+        cy, cz = self.points_array.mean(axis=0).tolist()
         self.centroid = (cy, cz)
 
+        # Polar moment is fixed by the positions; compute it once for all load cases.
+        rel = self.points_array - self.points_array.mean(axis=0)
+        self._Ip = float(np.vdot(rel, rel))
+
     @property
     def n(self) -> int:
         return len(self.bolts)
@@ -150,15 +162,7 @@ class BoltGroup:
 
     @property
     def Ip(self) -> float:
-        y_arr = np.array([b.position[0] for b in self.bolts], dtype=float)
-        z_arr = np.array([b.position[1] for b in self.bolts], dtype=float)
-
-        dy_arr = y_arr - self.Cy
-        dz_arr = z_arr - self.Cz
-
-        Iy = np.sum(dz_arr**2)
-        Iz = np.sum(dy_arr**2)
-        return float(Iy + Iz)
+        return self._Ip
 
     @classmethod
     def create(
@@ -192,6 +196,7 @@ class BoltConnection:
     threaded_in_shear_plane: Optional[bool] = None
 
     bolt_group: BoltGroup = field(init=False)
+    bolt_ks: np.ndarray = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         self.bolt_group = BoltGroup.create(self.layout, self.bolt)
@@ -208,6 +213,7 @@ class BoltConnection:
             k = float(b.params.E * b.params.area / total_thickness)
             b.params.stiffness = k
             b.k = k
+        self.bolt_ks = np.array([b.k for b in self.bolt_group.bolts], dtype=np.float64)
 
     def analyze(
         self,
@@ -215,10 +221,50 @@ class BoltConnection:
         shear_method: str = "elastic",
         tension_method: str = "conservative",
     ) -> "LoadedBoltConnection":
-        from .analysis import LoadedBoltConnection
-        return LoadedBoltConnection(
+        global _LoadedBoltConnection
+        if _LoadedBoltConnection is None:
+            from .analysis import LoadedBoltConnection as _LoadedBoltConnection
+        return _LoadedBoltConnection(
             bolt_connection=self,
             load=load,
             shear_method=shear_method,
             tension_method=tension_method,
         )
+
+    def elastic_shear_batch(self, loads: Sequence["Load"]) -> tuple[np.ndarray, np.ndarray]:
+        """Elastic in-plane bolt shear for many load cases at once.
+
+        Equivalent to ``analyze(load, shear_method="elastic")`` per load, but
+        solved in one vectorized pass without building result objects.
+
+        Returns:
+            (Fy, Fz) arrays shaped (n_loads, n_bolts).
+        """
+        return solve_bolt_elastic_batch(
+            bolt_coords=self.bolt_group.points_array,
+            Fx=[load.Fy for load in loads],
+            Fy=[load.Fz for load in loads],
+            Mz=[load.Mx for load in loads],
+            x_loc=[load.y_loc for load in loads],
+            y_loc=[load.z_loc for load in loads],
+        )
+
+    def icr_shear_batch(self, loads: Sequence["Load"]) -> tuple[np.ndarray, np.ndarray]:
+        """ICR in-plane bolt shear for many load cases at once.
+
+        Equivalent to ``analyze(load, shear_method="icr")`` per load, but
+        each solve is warm-started from the previous load's ICR and no
+        result objects are built.
+
+        Returns:
+            (Fy, Fz) arrays shaped (n_loads, n_bolts).
+        """
+        fys, fzs, _ = solve_bolt_icr_batch(
+            bolt_coords=self.bolt_group.points_array,
+            Fx=[load.Fy for load in loads],
+            Fy=[load.Fz for load in loads],
+            Mz=[load.Mx for load in loads],
+            x_loc=[load.y_loc for load in loads],
+            y_loc=[load.z_loc for load in loads],
+        )
+        return fys, fzs
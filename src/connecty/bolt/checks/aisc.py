@@ -33,15 +33,13 @@ def check_aisc(
     plate = connection.bolt_connection.plate
     bolts = connection.bolt_connection.bolt_group.bolts
 
-    fxs = list(connection._fxs)
-    fys = list(connection._fys)
-    fzs = list(connection._fzs)
+    forces = connection.to_bolt_forces_soa()
 
     results: dict[str, Any] = {}
 
-    T_u = fxs  # tension is out-of-plane (x direction)
-    V_u = [float(np.sqrt(y**2 + z**2)) for y, z in zip(fys, fzs)]
-    V_u_total = float(np.sqrt(sum(fys) ** 2 + sum(fzs) ** 2))
+    T_u = forces["Fx"].tolist()  # tension is out-of-plane (x direction)
+    V_u = forces["shear"].tolist()
+    V_u_total = float(np.hypot(forces["Fy"].sum(), forces["Fz"].sum()))
 
     U_tension: list[float] = []
     U_shear: list[float] = []
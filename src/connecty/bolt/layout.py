@@ -2,6 +2,9 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass, field
+from functools import cached_property
+
+import numpy as np
 
 
 @dataclass(frozen=True)
@@ -80,23 +83,40 @@ class BoltLayout:
         start_rad = math.radians(start_angle)
         step = 2 * math.pi / n
 
-        pts: list[tuple[float, float]] = []
-        for i in range(n):
-            angle = start_rad + i * step
-            y = cy + radius * math.sin(angle)
-            z = cz + radius * math.cos(angle)
-            pts.append((y, z))
+        if n < 8:
+            pts: list[tuple[float, float]] = []
+            for i in range(n):
+                angle = start_rad + i * step
+                y = cy + radius * math.sin(angle)
+                z = cz + radius * math.cos(angle)
+                pts.append((y, z))
+            return cls(points=pts)
 
-        return cls(points=pts)
+        # One complex-exp sweep gives cos (real) and sin (imag) together.
+        unit = np.exp(1j * (start_rad + step * np.arange(n)))
+        ys = cy + radius * unit.imag
+        zs = cz + radius * unit.real
+        return cls(points=list(zip(ys.tolist(), zs.tolist())))
 
     @property
     def n(self) -> int:
         return len(self.points)
 
+    @cached_property
+    def points_array(self) -> np.ndarray:
+        """Bolt positions as a contiguous (N, 2) float array of (y, z)."""
+        return np.ascontiguousarray(self.points, dtype=np.float64)
+
+    @cached_property
+    def centroid(self) -> tuple[float, float]:
+        """Bolt-group centroid (Cy, Cz); the layout is frozen, so computed once."""
+        cy, cz = self.points_array.mean(axis=0).tolist()
+        return (cy, cz)
+
     @property
     def Cy(self) -> float:
-        return sum(p[0] for p in self.points) / self.n
+        return self.centroid[0]
 
     @property
     def Cz(self) -> float:
-        return sum(p[1] for p in self.points) / self.n
+        return self.centroid[1]
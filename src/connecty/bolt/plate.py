@@ -76,29 +76,41 @@ class Plate:
             elif self.surface_class == "B":
                 object.__setattr__(self, "slip_coefficient", 0.50)
 
+        # Bounds are fixed for a frozen plate; compute them once.
+        y_min = float(min(self.corner_a[0], self.corner_b[0]))
+        y_max = float(max(self.corner_a[0], self.corner_b[0]))
+        z_min = float(min(self.corner_a[1], self.corner_b[1]))
+        z_max = float(max(self.corner_a[1], self.corner_b[1]))
+        object.__setattr__(self, "_y_min", y_min)
+        object.__setattr__(self, "_y_max", y_max)
+        object.__setattr__(self, "_z_min", z_min)
+        object.__setattr__(self, "_z_max", z_max)
+        object.__setattr__(self, "_depth_y", y_max - y_min)
+        object.__setattr__(self, "_depth_z", z_max - z_min)
+
     @property
     def y_min(self) -> float:
-        return float(min(self.corner_a[0], self.corner_b[0]))
+        return self._y_min
 
     @property
     def y_max(self) -> float:
-        return float(max(self.corner_a[0], self.corner_b[0]))
+        return self._y_max
 
     @property
     def z_min(self) -> float:
-        return float(min(self.corner_a[1], self.corner_b[1]))
+        return self._z_min
 
     @property
     def z_max(self) -> float:
-        return float(max(self.corner_a[1], self.corner_b[1]))
+        return self._z_max
 
     @property
     def depth_y(self) -> float:
-        return self.y_max - self.y_min
+        return self._depth_y
 
     @property
     def depth_z(self) -> float:
-        return self.z_max - self.z_min
+        return self._depth_z
 
     @property
     def width(self) -> float:
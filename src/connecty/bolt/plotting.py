@@ -2,6 +2,16 @@
 Plotting helpers for bolt connections.
 
 All save outputs are forced to `.svg` when `save_path` is provided.
+
+For parameter sweeps, create one figure and pass its axes to every call
+with `clear=True, show=False`; each call then redraws into the same axes
+instead of opening a new figure. Passing `reuse_ax=True` without an axes
+does the same with a module-level scratch figure, which is recreated only
+if it has been closed. `tight_layout` is only applied to figures these
+helpers create themselves, and only when they are saved or shown.
+
+Matplotlib is imported inside the plotting functions so that importing
+`connecty.bolt` does not pay its import cost when nothing is plotted.
 """
 
 from __future__ import annotations
@@ -11,17 +21,15 @@ from typing import TYPE_CHECKING, Literal
 import math
 
 import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.colors as mcolors
-from matplotlib.patches import Circle, Rectangle
-from matplotlib.lines import Line2D
-from matplotlib.legend import Legend
 
-from .load import Load
+from ..common.load import Load
 from .bolt import BoltGroup
 from .plate import Plate
 
 if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+    from matplotlib.colors import Colormap
+    from matplotlib.legend import Legend
     from .analysis import LoadedBoltConnection
 
 
@@ -29,6 +37,8 @@ def plot_shear_distribution(
     result: "LoadedBoltConnection",
     *,
     ax: plt.Axes | None = None,
+    clear: bool = False,
+    reuse_ax: bool = False,
     show: bool = True,
     save_path: str | Path | None = None,
     colorbar: bool = True,
@@ -36,11 +46,13 @@ def plot_shear_distribution(
     force_unit: str = "N",
     length_unit: str = "mm",
 ) -> plt.Axes:
-    """Plot plate, bolts, and in-plane shear forces (Fx, Fy)."""
+    """Plot plate, bolts, and in-plane shear forces (Fy, Fz)."""
     return _plot_distribution(
         result=result,
         mode="shear",
         ax=ax,
+        clear=clear,
+        reuse_ax=reuse_ax,
         show=show,
         save_path=save_path,
         colorbar=colorbar,
@@ -54,6 +66,8 @@ def plot_tension_distribution(
     result: "LoadedBoltConnection",
     *,
     ax: plt.Axes | None = None,
+    clear: bool = False,
+    reuse_ax: bool = False,
     show: bool = True,
     save_path: str | Path | None = None,
     colorbar: bool = True,
@@ -61,11 +75,13 @@ def plot_tension_distribution(
     force_unit: str = "N",
     length_unit: str = "mm",
 ) -> plt.Axes:
-    """Plot plate, bolts, and out-of-plane tension forces (Fz)."""
+    """Plot plate, bolts, and out-of-plane tension forces (Fx)."""
     return _plot_distribution(
         result=result,
         mode="tension",
         ax=ax,
+        clear=clear,
+        reuse_ax=reuse_ax,
         show=show,
         save_path=save_path,
         colorbar=colorbar,
@@ -80,6 +96,8 @@ def _plot_distribution(
     mode: Literal["shear", "tension"],
     *,
     ax: plt.Axes | None = None,
+    clear: bool = False,
+    reuse_ax: bool = False,
     show: bool = True,
     save_path: str | Path | None = None,
     colorbar: bool = True,
@@ -88,10 +106,16 @@ def _plot_distribution(
     length_unit: str = "mm",
 ) -> plt.Axes:
     """Internal helper to plot bolt distribution."""
+    import matplotlib.pyplot as plt
+    import matplotlib.colors as mcolors
+    from matplotlib.lines import Line2D
+
+    owns_figure = ax is None
     if ax is None:
-        fig, ax = plt.subplots(figsize=(10, 8))
-    else:
-        fig = ax.figure
+        ax = _get_scratch_ax((10, 8)) if reuse_ax else plt.subplots(figsize=(10, 8))[1]
+    elif clear:
+        _clear_axes(ax)
+    fig = ax.figure
 
     bolt_group = result.bolt_connection.bolt_group
     bolts = bolt_group.bolts
@@ -106,16 +130,21 @@ def _plot_distribution(
     force_scale = 0.001  # Convert to kN as requested for both modes
     display_force_unit = "kN"
 
+    # Bolt positions are (y, z); plots use z horizontal and y vertical.
+    soa = result.to_bolt_forces_soa()
+    ys = soa["y"]
+    zs = soa["z"]
+    fys = soa["Fy"]
+    fzs = soa["Fz"]
+    positions = np.column_stack([ys, zs])
+
     # Extract values
-    vals = []
-    for b in bolts:
-        fx, fy, fz = b.forces
-        if mode == "shear":
-            # Shear magnitude
-            vals.append(np.sqrt(fx**2 + fy**2) * force_scale)
-        else:
-            # Axial (tension) force
-            vals.append(fz * force_scale)
+    if mode == "shear":
+        # Shear magnitude
+        vals = soa["shear"] * force_scale
+    else:
+        # Axial (tension) force
+        vals = soa["Fx"] * force_scale
 
     if mode == "shear":
         color_label = f"Bolt Shear ({display_force_unit})"
@@ -126,62 +155,43 @@ def _plot_distribution(
         title_metric = "Max Tension"
         draw_arrows = False
 
-    force_min = min(vals) if vals else 0.0
-    force_max = max(vals) if vals else 0.0
+    force_min = float(vals.min()) if vals.size else 0.0
+    force_max = float(vals.max()) if vals.size else 0.0
 
     if force_max - force_min > 1e-12:
         norm = mcolors.Normalize(vmin=force_min, vmax=force_max)
     else:
         norm = mcolors.Normalize(vmin=0.0, vmax=max(force_max, 1.0))
 
-    colormap = plt.get_cmap(cmap)
+    colormap = _get_cmap(cmap)
 
     # Assume all bolts have same diameter for visualization
     bolt_diameter = bolts[0].params.diameter if bolts else 10.0
     visual_radius = bolt_diameter / 2.0
 
-    x_coords = [b.position[0] for b in bolts]
-    y_coords = [b.position[1] for b in bolts]
-
-    extent = max(
-        (max(x_coords) - min(x_coords)) if x_coords else 1.0,
-        (max(y_coords) - min(y_coords)) if y_coords else 1.0,
-        bolt_diameter * 4.0,
+    # One reduction over the (N, 2) positions for both spans.
+    extent = max(float(np.ptp(positions, axis=0).max()), bolt_diameter * 4.0)
+
+    # All bolts in one collection, coloured in a single colormap pass. Circles
+    # are rasterized only on figures made here that will not be exported;
+    # a caller-supplied axes may still be saved as vector output.
+    rgba = colormap(norm(vals))
+    _add_bolt_circles(
+        ax,
+        np.column_stack([zs, ys]),
+        visual_radius,
+        facecolors=rgba,
+        rasterized=owns_figure and save_path is None,
     )
 
-    # Arrow scaling (shear only)
-    #
-    # IMPORTANT: keep arrow math in the same units as `b.forces` (N).
-    # The color values above are converted to kN, but the arrow vectors are not.
-    arrow_scale = 1.0
-    if mode == "shear":
-        shear_mags_n = [float(np.hypot(b.forces[0], b.forces[1])) for b in bolts]
-        shear_max_n = max(shear_mags_n) if shear_mags_n else 0.0
-        # Make the *longest* arrow about 25% of the plot extent.
-        arrow_target_len = 0.25 * extent
-        arrow_scale = arrow_target_len / shear_max_n if shear_max_n > 1e-12 else 1.0
-
-    for i, b in enumerate(bolts):
-        value = vals[i]
-        color = colormap(norm(value))
-
-        # position is (x, y)
-        bx, by = b.position
-
-        circle = Circle(
-            (bx, by),
-            radius=visual_radius,
-            facecolor=color,
-            edgecolor="black",
-            linewidth=1.5,
-            zorder=3,
-        )
-        ax.add_patch(circle)
-
-        ax.text(
-            bx,
-            by - visual_radius * 1.2,
-            str(i + 1),
+    # Labels sit just below each bolt; offsets computed once for all bolts.
+    text = ax.text
+    label_ys = (ys - visual_radius * 1.2).tolist()
+    for i, (bz, label_y) in enumerate(zip(zs.tolist(), label_ys), start=1):
+        text(
+            bz,
+            label_y,
+            str(i),
             ha="center",
             va="top",
             fontsize=8,
@@ -189,29 +199,41 @@ def _plot_distribution(
             zorder=4,
         )
 
-        if draw_arrows and value > 1e-12:
-            fx, fy, _ = b.forces
-            arrow_length_x = fx * arrow_scale
-            arrow_length_y = fy * arrow_scale
-            ax.arrow(
-                bx,
-                by,
-                arrow_length_x,
-                arrow_length_y,
-                head_width=visual_radius * 0.8,
-                head_length=visual_radius * 0.5,
-                fc="black",
-                ec="black",
-                linewidth=1.5,
+    # Arrow scaling (shear only)
+    #
+    # IMPORTANT: keep arrow math in the same units as the bolt forces (N).
+    # The color values above are converted to kN, but the arrow vectors are not.
+    if draw_arrows:
+        shear_mags_n = soa["shear"]
+        # vals are these magnitudes in kN, so their max is already known.
+        shear_max_n = force_max / force_scale
+        # Make the *longest* arrow about 25% of the plot extent.
+        arrow_target_len = 0.25 * extent
+        arrow_scale = arrow_target_len / shear_max_n if shear_max_n > 1e-12 else 1.0
+
+        # Mask on the same N magnitudes that set the scale, not the kN colours.
+        loaded = shear_mags_n > 1e-12
+        if np.any(loaded):
+            ax.quiver(
+                zs[loaded],
+                ys[loaded],
+                fzs[loaded] * arrow_scale,
+                fys[loaded] * arrow_scale,
+                angles="xy",
+                scale_units="xy",
+                scale=1.0,
+                color="black",
+                width=0.004,
                 zorder=4,
                 alpha=0.8,
             )
 
     if colorbar and bolts:
-        sm = plt.cm.ScalarMappable(cmap=cmap, norm=norm)
+        sm = plt.cm.ScalarMappable(cmap=colormap, norm=norm)
         sm.set_array([])
         cbar = fig.colorbar(sm, ax=ax, shrink=0.8, aspect=30)
         cbar.set_label(color_label, fontsize=10)
+        _track_colorbar(ax, cbar)
 
     if mode == "tension":
         _plot_neutral_axes(ax=ax, result=result, bolt_group=bolt_group)
@@ -220,14 +242,23 @@ def _plot_distribution(
             # Plot pressure heatmap
             pressure_max = np.max(result.plate_pressure)
             if pressure_max > 1e-6:
+                pressure = result.plate_pressure
+                if save_path is None:
+                    # Screen preview only: single precision, at most ~512 px a side,
+                    # and no resampling filter. SVG export keeps the full grid.
+                    step = max(1, -(-max(pressure.shape) // _PREVIEW_PRESSURE_PX))
+                    pressure = np.asarray(pressure[::step, ::step], dtype=np.float32)
+                    interpolation = "nearest"
+                else:
+                    interpolation = "bilinear"
                 im = ax.imshow(
-                    result.plate_pressure,
+                    pressure,
                     origin="lower",
                     extent=result.plate_pressure_extent,
                     cmap="Blues",
                     alpha=0.6,
                     zorder=2,
-                    interpolation="bilinear",
+                    interpolation=interpolation,
                 )
                 
                 # Add colorbar for pressure on the left
@@ -235,6 +266,7 @@ def _plot_distribution(
                 try:
                     cbar_p = fig.colorbar(im, ax=ax, location="left", shrink=0.8)
                     cbar_p.set_label("Plate Pressure (MPa)", fontsize=10)
+                    _track_colorbar(ax, cbar_p)
                 except TypeError:
                     # Fallback for older matplotlib versions if 'location' is not supported
                     # We simply don't plot it on the left to avoid crashing, 
@@ -242,9 +274,9 @@ def _plot_distribution(
                     pass
 
     if mode == "shear" and result.icr_point is not None:
-        icr_x, icr_y = result.icr_point
+        icr_y, icr_z = result.icr_point
         ax.plot(
-            icr_x,
+            icr_z,
             icr_y,
             "ko",
             markersize=10,
@@ -255,18 +287,19 @@ def _plot_distribution(
         )
 
     ax.set_aspect("equal")
-    ax.set_xlabel(f"x ({length_unit})", fontsize=11)
+    ax.set_xlabel(f"z ({length_unit})", fontsize=11)
     ax.set_ylabel(f"y ({length_unit})", fontsize=11)
     ax.grid(True, alpha=0.3, linestyle="--")
 
     margin = extent * 0.15
-    ax.set_xlim(plate.x_min - margin, plate.x_max + margin)
+    ax.set_xlim(plate.z_min - margin, plate.z_max + margin)
     ax.set_ylim(plate.y_min - margin, plate.y_max + margin)
 
     applied_legend = _plot_applied_force(
         ax=ax,
         load=result.load,
         bolt_group=bolt_group,
+        load_at_centroid=result.load_at_centroid,
         force_unit=display_force_unit,
         length_unit=length_unit,
         mode=mode,
@@ -274,7 +307,7 @@ def _plot_distribution(
     )
 
     if mode == "shear" and result.icr_point is not None:
-        icr_x, icr_y = result.icr_point
+        icr_y, icr_z = result.icr_point
         icr_handle = Line2D(
             [0],
             [0],
@@ -285,7 +318,7 @@ def _plot_distribution(
             markeredgewidth=2,
             color="black",
         )
-        icr_text = f"x={icr_x:.2f}, y={icr_y:.2f} {length_unit}"
+        icr_text = f"y={icr_y:.2f}, z={icr_z:.2f} {length_unit}"
 
         # Keep Applied Load legend (top-left) and add ICR legend (top-right).
         if applied_legend is not None:
@@ -295,16 +328,15 @@ def _plot_distribution(
     title = f"Bolt Connection Analysis ({mode.title()})\n"
     title += f"{bolt_group.n} × {bolt_diameter:.1f}{length_unit} bolts"
     if bolts:
-        title += f" | {title_metric}: {force_max:.2f} {force_unit}"
+        title += f" | {title_metric}: {force_max:.2f} {display_force_unit}"
     ax.set_title(title, fontsize=12)
 
-    plt.tight_layout()
+    # A caller-supplied axes belongs to a layout the caller manages.
+    if owns_figure and (save_path is not None or show):
+        plt.tight_layout()
 
     if save_path is not None:
-        out = Path(save_path)
-        if out.suffix.lower() != ".svg":
-            out = out.with_suffix(".svg")
-        fig.savefig(str(out), format="svg", bbox_inches="tight")
+        _save_svg(fig, save_path)
 
     if show:
         plt.show()
@@ -312,38 +344,158 @@ def _plot_distribution(
     return ax
 
 
+def _add_bolt_circles(
+    ax: plt.Axes,
+    centers: np.ndarray,
+    radius: float,
+    *,
+    facecolors,
+    rasterized: bool = False,
+) -> None:
+    """Draw all bolts as one collection sharing a single circle path.
+
+    `centers` is an (N, 2) array of (z, y) plot coordinates. With
+    `rasterized`, the circles are drawn as an image on vector backends;
+    labels and other artists stay vector.
+    """
+    from matplotlib.collections import EllipseCollection
+
+    n = centers.shape[0]
+    if n == 0:
+        return
+    diameters = np.full(n, 2.0 * radius)
+    circles = EllipseCollection(
+        diameters,
+        diameters,
+        np.zeros(n),
+        units="xy",
+        offsets=centers,
+        offset_transform=ax.transData,
+        facecolors=facecolors,
+        edgecolors="black",
+        linewidths=1.5,
+        zorder=3,
+        rasterized=rasterized,
+    )
+    # Callers set explicit axis limits, so skip the data-limit update.
+    ax.add_collection(circles, autolim=False)
+
+
+_CMAP_CACHE: dict[str, Colormap] = {}
+
+
+def _get_cmap(name: str) -> Colormap:
+    """Look up a registered colormap once per name.
+
+    The registry hands out a fresh copy on every lookup; the plots here never
+    modify the colormap, so one copy per name is shared.
+    """
+    colormap = _CMAP_CACHE.get(name)
+    if colormap is None:
+        import matplotlib as mpl
+
+        colormap = _CMAP_CACHE[name] = mpl.colormaps[name]
+    return colormap
+
+
+# Longest side, in samples, of a plate pressure grid drawn for screen preview.
+_PREVIEW_PRESSURE_PX = 512
+
+
+# Text stays as <text> instead of glyph paths, paths are simplified, and the
+# id salt and date are fixed so repeated saves of the same plot are identical.
+_SVG_RC = {
+    "svg.fonttype": "none",
+    "svg.hashsalt": "connecty",
+    "path.simplify": True,
+    "path.simplify_threshold": 1.0,
+}
+
+
+def _save_svg(fig, save_path: str | Path) -> None:
+    """Save `fig` as compact, reproducible SVG (suffix forced to `.svg`)."""
+    import matplotlib as mpl
+
+    out = Path(save_path)
+    if out.suffix.lower() != ".svg":
+        out = out.with_suffix(".svg")
+    with mpl.rc_context(_SVG_RC):
+        fig.savefig(str(out), format="svg", bbox_inches="tight", metadata={"Date": None})
+
+
+_scratch_ax: plt.Axes | None = None
+
+
+def _get_scratch_ax(figsize: tuple[float, float]) -> plt.Axes:
+    """Return the shared scratch axes, cleared and resized for the next plot."""
+    global _scratch_ax
+    import matplotlib.pyplot as plt
+
+    ax = _scratch_ax
+    if ax is None or not plt.fignum_exists(ax.figure.number):
+        _, ax = plt.subplots(figsize=figsize)
+        _scratch_ax = ax
+    else:
+        _clear_axes(ax)
+        ax.figure.set_size_inches(figsize)
+    return ax
+
+
+def _track_colorbar(ax: plt.Axes, cbar) -> None:
+    """Remember a colorbar attached to `ax` so `_clear_axes` can remove it."""
+    colorbars = getattr(ax, "_connecty_colorbars", None)
+    if colorbars is None:
+        colorbars = []
+        ax._connecty_colorbars = colorbars
+    colorbars.append(cbar)
+
+
+def _clear_axes(ax: plt.Axes) -> None:
+    """Clear `ax` for reuse, including colorbars added by a previous plot."""
+    for cbar in getattr(ax, "_connecty_colorbars", ()):
+        cbar.remove()
+    ax._connecty_colorbars = []
+    ax.cla()
+
+
 def plot_bolt_pattern(
     bolt_group: BoltGroup,
     *,
     ax: plt.Axes | None = None,
+    clear: bool = False,
+    reuse_ax: bool = False,
     show: bool = True,
     save_path: str | Path | None = None,
     length_unit: str = "mm",
     bolt_diameter: float = 10.0,
 ) -> plt.Axes:
     """Plot bolt group pattern without analysis results."""
+    import matplotlib.pyplot as plt
+
+    owns_figure = ax is None
     if ax is None:
-        fig, ax = plt.subplots(figsize=(8, 8))
-    else:
-        fig = ax.figure
+        ax = _get_scratch_ax((8, 8)) if reuse_ax else plt.subplots(figsize=(8, 8))[1]
+    elif clear:
+        _clear_axes(ax)
+    fig = ax.figure
 
     visual_radius = float(bolt_diameter) / 2.0
 
-    # points are (x, y)
-    for i, (x, y) in enumerate(bolt_group.points):
-        circle = Circle(
-            (x, y),
-            radius=visual_radius,
-            facecolor="steelblue",
-            edgecolor="black",
-            linewidth=1.5,
-            zorder=3,
-        )
-        ax.add_patch(circle)
-        ax.text(
-            x,
+    # points are (y, z); plotted with z horizontal
+    pts = bolt_group.points_array
+    _add_bolt_circles(
+        ax,
+        pts[:, ::-1],
+        visual_radius,
+        facecolors="steelblue",
+        rasterized=owns_figure and save_path is None,
+    )
+    text = ax.text
+    for i, (y, z) in enumerate(pts.tolist(), start=1):
+        text(
+            z,
             y,
-            str(i + 1),
+            str(i),
             ha="center",
             va="center",
             fontsize=8,
@@ -352,38 +504,32 @@ def plot_bolt_pattern(
             zorder=4,
         )
 
-    ax.plot(bolt_group.Cx, bolt_group.Cy, "k+", markersize=12, markeredgewidth=2, label="Centroid")
+    ax.plot(bolt_group.Cz, bolt_group.Cy, "k+", markersize=12, markeredgewidth=2, label="Centroid")
 
     ax.set_aspect("equal")
-    ax.set_xlabel(f"x ({length_unit})", fontsize=11)
+    ax.set_xlabel(f"z ({length_unit})", fontsize=11)
     ax.set_ylabel(f"y ({length_unit})", fontsize=11)
     ax.grid(True, alpha=0.3, linestyle="--")
     ax.legend(loc="upper right")
 
-    x_coords = [p[0] for p in bolt_group.points]
-    y_coords = [p[1] for p in bolt_group.points]
-    margin = max(
-        (max(x_coords) - min(x_coords)) if x_coords else 0,
-        (max(y_coords) - min(y_coords)) if y_coords else 0,
-        bolt_diameter * 4.0,
-    ) * 0.3
-
-    if not x_coords:  # Handle empty group
+    if pts.shape[0] == 0:  # Handle empty group
         ax.set_xlim(-10, 10)
         ax.set_ylim(-10, 10)
     else:
-        ax.set_xlim(min(x_coords) - margin, max(x_coords) + margin)
-        ax.set_ylim(min(y_coords) - margin, max(y_coords) + margin)
+        # One min and one max reduction over (N, 2); spans derive from them.
+        (y_lo, z_lo), (y_hi, z_hi) = pts.min(axis=0).tolist(), pts.max(axis=0).tolist()
+        margin = max(z_hi - z_lo, y_hi - y_lo, bolt_diameter * 4.0) * 0.3
+        ax.set_xlim(z_lo - margin, z_hi + margin)
+        ax.set_ylim(y_lo - margin, y_hi + margin)
 
     ax.set_title(f"Bolt Pattern: {bolt_group.n} bolts", fontsize=12)
 
-    plt.tight_layout()
+    # A caller-supplied axes belongs to a layout the caller manages.
+    if owns_figure and (save_path is not None or show):
+        plt.tight_layout()
 
     if save_path is not None:
-        out = Path(save_path)
-        if out.suffix.lower() != ".svg":
-            out = out.with_suffix(".svg")
-        fig.savefig(str(out), format="svg", bbox_inches="tight")
+        _save_svg(fig, save_path)
 
     if show:
         plt.show()
@@ -401,40 +547,45 @@ def _plot_applied_force(
     mode: Literal["shear", "tension"],
     extent: float | None = None, # kept for backward compatibility if needed, but unused in logic below if we use ax limits
     force_scale: float = 1.0,
+    load_at_centroid: Load | None = None,
 ) -> Legend | None:
-    """Plot applied load location and annotate key components."""
-    x_loc, y_loc, _ = load.location
-    ax.plot(x_loc, y_loc, "kx", markersize=10, markeredgewidth=2, label="Load Location", zorder=5)
+    """Plot applied load location and annotate key components.
+
+    `load_at_centroid` is the load transferred to (0, Cy, Cz); it is derived
+    from `load` when not supplied.
+    """
+    from matplotlib.lines import Line2D
 
-    # Intentionally do not draw Mx/My vectors on the tension plot.
+    _, y_loc, z_loc = load.location
+    ax.plot(z_loc, y_loc, "kx", markersize=10, markeredgewidth=2, label="Load Location", zorder=5)
+
+    # Intentionally do not draw My/Mz vectors on the tension plot.
     # The tension figure already contains NA/pressure visuals; adding moment arrows tends to clutter it.
 
     labels: list[str] = []
-    
+
+    if load_at_centroid is None:
+        load_at_centroid = load.equivalent_at((0.0, bolt_group.Cy, bolt_group.Cz))
+
     if mode == "shear":
-        if abs(load.Fx) > 1e-6:
-            labels.append(f"Fx = {load.Fx * force_scale:.2f} {force_unit}")
         if abs(load.Fy) > 1e-6:
             labels.append(f"Fy = {load.Fy * force_scale:.2f} {force_unit}")
-            
-        Cx, Cy = bolt_group.Cx, bolt_group.Cy
-        load_at_centroid = load.equivalent_at((Cx, Cy, 0.0))
-        
-        if abs(load_at_centroid.Mz) > 1e-6:
-            labels.append(f"Mz = {load_at_centroid.Mz * force_scale:.2f} {force_unit}·{length_unit}")
-
-    if mode == "tension":
         if abs(load.Fz) > 1e-6:
-            labels.append(f"Fz (axial) = {load.Fz * force_scale:.2f} {force_unit}")
+            labels.append(f"Fz = {load.Fz * force_scale:.2f} {force_unit}")
 
-        # Keep Mx/My in the legend for reporting, but do not draw them graphically.
-        Cx, Cy = bolt_group.Cx, bolt_group.Cy
-        load_at_centroid = load.equivalent_at((Cx, Cy, 0.0))
 
         if abs(load_at_centroid.Mx) > 1e-6:
             labels.append(f"Mx = {load_at_centroid.Mx * force_scale:.2f} {force_unit}·{length_unit}")
+
+    if mode == "tension":
+        if abs(load.Fx) > 1e-6:
+            labels.append(f"Fx (axial) = {load.Fx * force_scale:.2f} {force_unit}")
+
+        # Keep My/Mz in the legend for reporting, but do not draw them graphically.
         if abs(load_at_centroid.My) > 1e-6:
             labels.append(f"My = {load_at_centroid.My * force_scale:.2f} {force_unit}·{length_unit}")
+        if abs(load_at_centroid.Mz) > 1e-6:
+            labels.append(f"Mz = {load_at_centroid.Mz * force_scale:.2f} {force_unit}·{length_unit}")
 
     if labels:
         text = "\n".join(labels)
@@ -446,9 +597,11 @@ def _plot_applied_force(
 
 def _plot_plate(ax: plt.Axes, plate: Plate) -> None:
     """Plot plate boundary as a prominent rectangle."""
+    from matplotlib.patches import Rectangle
+
     rect = Rectangle(
-        (plate.x_min, plate.y_min),
-        plate.depth_x,
+        (plate.z_min, plate.y_min),
+        plate.depth_z,
         plate.depth_y,
         linewidth=3,
         edgecolor="darkgray",
@@ -466,14 +619,16 @@ def _plot_neutral_axes(*, ax: plt.Axes, result: "LoadedBoltConnection", bolt_gro
     if plate is None:
         return
 
-    Cx, Cy = bolt_group.Cx, bolt_group.Cy
-    load_at_centroid = result.load.equivalent_at((Cx, Cy, 0.0))
-    Mx = load_at_centroid.Mx
-    My = load_at_centroid.My
+    # Bending moments at the centroid (0, Cy, Cz), as used by the analysis.
+    Cy, Cz = bolt_group.Cy, bolt_group.Cz
+    My = result.load_at_centroid.My
+    Mz = result.load_at_centroid.Mz
 
-    if abs(Mx) < 1e-6 and abs(My) < 1e-6:
+    if abs(My) < 1e-6 and abs(Mz) < 1e-6:
         return
 
+    y_min, y_max, z_min, z_max = plate.y_min, plate.y_max, plate.z_min, plate.z_max
+
     # Neutral Axis logic:
     # This is a visualization approximation or result display.
     # The actual neutral axis is computed as a line in the plane.
@@ -481,61 +636,70 @@ def _plot_neutral_axes(*, ax: plt.Axes, result: "LoadedBoltConnection", bolt_gro
     
     if result.neutral_axis is not None:
         theta, c = result.neutral_axis
-        # Line equation: x*cos(theta) + y*sin(theta) = c
+        # Line equation: y*cos(theta) + z*sin(theta) = c
         # We want to plot this line within the plate bounds.
         
-        # Calculate intersections with plate bounding box for plotting
-        points = []
-        
-        # Intersection with x_min
-        if abs(np.sin(theta)) > 1e-6:
-            y = (c - plate.x_min * np.cos(theta)) / np.sin(theta)
-            if plate.y_min <= y <= plate.y_max:
-                points.append((plate.x_min, y))
-                
-        # Intersection with x_max
-        if abs(np.sin(theta)) > 1e-6:
-            y = (c - plate.x_max * np.cos(theta)) / np.sin(theta)
-            if plate.y_min <= y <= plate.y_max:
-                points.append((plate.x_max, y))
-                
-        # Intersection with y_min
-        if abs(np.cos(theta)) > 1e-6:
-            x = (c - plate.y_min * np.sin(theta)) / np.cos(theta)
-            if plate.x_min <= x <= plate.x_max:
-                points.append((x, plate.y_min))
-
-        # Intersection with y_max
-        if abs(np.cos(theta)) > 1e-6:
-            x = (c - plate.y_max * np.sin(theta)) / np.cos(theta)
-            if plate.x_min <= x <= plate.x_max:
-                points.append((x, plate.y_max))
-                
-        # Unique points
-        points = list(set(points))
+        # Intersections with the plate bounding box for plotting (as (z, y))
+        points = _na_line_box_intersect(theta, c, y_min, y_max, z_min, z_max)
+
         if len(points) >= 2:
-            p1, p2 = points[:2]
+            p1, p2 = points[0], points[-1]
             ax.plot([p1[0], p2[0]], [p1[1], p2[1]], "b--", linewidth=2, label="Neutral Axis")
             return
 
-    # Fallback visualization if exact NA not available or logic simple
+    # Fallback: the NA positions used by the tension distribution in analysis.
     if abs(My) > 1e-6:
-        # Bending around Y axis -> varies with X (sigma = M*x/I)
-        # Neutral axis is x = constant
+        # Bending about y -> varies with z; NA is z = constant
         if result.tension_method == "conservative":
-            na_x = float(bolt_group.Cx)
+            na_z = float(Cz)
         else:
-            # Simple approximation for visualization if solver didn't return NA
-            comp_edge_x = plate.x_min if My > 0.0 else plate.x_max
-            na_x = (float(bolt_group.Cx) + comp_edge_x) / 2.0 # Rough guess
-        ax.axvline(na_x, color="blue", linestyle="--", linewidth=1.5, alpha=0.7, label="Neutral Axis (approx)", zorder=2)
-
-    if abs(Mx) > 1e-6:
-        # Bending around X axis -> varies with Y (sigma = M*y/I)
-        # Neutral axis is y = constant
+            offset_z = (z_max - z_min) / 6.0
+            na_z = z_min + offset_z if My > 0.0 else z_max - offset_z
+        ax.axvline(na_z, color="blue", linestyle="--", linewidth=1.5, alpha=0.7, label="Neutral Axis (My)", zorder=2)
+
+    if abs(Mz) > 1e-6:
+        # Bending about z -> varies with y; NA is y = constant
         if result.tension_method == "conservative":
-            na_y = float(bolt_group.Cy)
+            na_y = float(Cy)
         else:
-            comp_edge_y = plate.y_min if Mx < 0.0 else plate.y_max # Check sign convention
-            na_y = (float(bolt_group.Cy) + comp_edge_y) / 2.0
-        ax.axhline(na_y, color="green", linestyle="--", linewidth=1.5, alpha=0.7, label="Neutral Axis (approx)", zorder=2)
+            offset_y = (y_max - y_min) / 6.0
+            na_y = y_min + offset_y if Mz > 0.0 else y_max - offset_y
+        ax.axhline(na_y, color="green", linestyle="--", linewidth=1.5, alpha=0.7, label="Neutral Axis (Mz)", zorder=2)
+
+
+def _na_line_box_intersect(
+    theta: float,
+    c: float,
+    y_min: float,
+    y_max: float,
+    z_min: float,
+    z_max: float,
+) -> list[tuple[float, float]]:
+    """Intersect the line y*cos(theta) + z*sin(theta) = c with a box.
+
+    Returns the distinct hits on the box edges as (z, y) points, in the
+    order y_min, y_max, z_min, z_max. A line through a corner hits two
+    edges there; the repeat is dropped with a tolerance so the order stays
+    deterministic.
+    """
+    s = math.sin(theta)
+    co = math.cos(theta)
+    points: list[tuple[float, float]] = []
+
+    if abs(s) > 1e-6:
+        for y in (y_min, y_max):
+            z = (c - y * co) / s
+            if z_min <= z <= z_max:
+                points.append((z, y))
+
+    if abs(co) > 1e-6:
+        for z in (z_min, z_max):
+            y = (c - z * s) / co
+            if y_min <= y <= y_max:
+                points.append((z, y))
+
+    unique: list[tuple[float, float]] = []
+    for p in points:
+        if all(abs(p[0] - q[0]) > 1e-9 or abs(p[1] - q[1]) > 1e-9 for q in unique):
+            unique.append(p)
+    return unique
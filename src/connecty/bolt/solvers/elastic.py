@@ -26,7 +26,8 @@ def solve_bolt_elastic(
     Returns:
     Tuple[np.ndarray, np.ndarray]: Bolt forces in (coord1, coord2) directions.
     """
-    bolt_coords = np.array(bolt_coords)  # Expected as [x, y]
+    # Read-only use, so no defensive copy of an existing float array.
+    bolt_coords = np.asarray(bolt_coords, dtype=float)  # Expected as [x, y]
     n = len(bolt_coords)
     
     # 1. Bolt-group centroid (Cx, Cy)
@@ -35,7 +36,7 @@ def solve_bolt_elastic(
     
     # 2. Polar Moment of Inertia (Ip)
     rel_coords = bolt_coords - centroid
-    Ip = np.sum(rel_coords**2)
+    Ip = float(np.vdot(rel_coords, rel_coords))  # sum of squares, no temporary
     
     # 3. Transfer loads to Centroid (Mz_total)
     # Moment Mz = (r x F)_z = dx*Fy - dy*Fx
@@ -59,18 +60,61 @@ def solve_bolt_elastic(
     # rel_coords[:, 1] is dy (y - Cy)
     
     if Ip > 1e-12:
-        Fx_m = -(Mz_total * rel_coords[:, 1]) / Ip
-        Fy_m = (Mz_total * rel_coords[:, 0]) / Ip
+        k = Mz_total / Ip
+        bolt_forces_x = Fx_p - k * rel_coords[:, 1]
+        bolt_forces_y = Fy_p + k * rel_coords[:, 0]
     else:
-        Fx_m = np.zeros(n)
-        Fy_m = np.zeros(n)
-    
-    bolt_forces_x = Fx_p + Fx_m
-    bolt_forces_y = Fy_p + Fy_m
+        bolt_forces_x = np.full(n, Fx_p)
+        bolt_forces_y = np.full(n, Fy_p)
     
     return bolt_forces_x, bolt_forces_y
 
-# --- Example Usage ---
-# bolts = np.array([[0, 0], [3, 0], [0, 3], [3, 3]])
-# Fx=10 kip, Fy=0, Mz=50 kip-in, applied at x=6, y=1.5
-# results = solve_bolt_elastic(bolts, Fx=10, Fy=0, Mz=50, x_loc=6, y_loc=1.5)
+
+def solve_bolt_elastic_batch(
+    bolt_coords: np.ndarray,
+    Fx: np.ndarray,
+    Fy: np.ndarray,
+    Mz: np.ndarray,
+    x_loc: np.ndarray,
+    y_loc: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Elastic Method for many load cases on one bolt pattern.
+
+    Same conventions as `solve_bolt_elastic`, with each load argument an
+    array of length L (one entry per load case). The geometry (centroid,
+    Ip) is computed once and all cases are solved with a single broadcast.
+
+    Returns:
+    Tuple[np.ndarray, np.ndarray]: Bolt forces in (coord1, coord2) directions,
+    each shaped (L, N) so that row l holds the forces for load case l.
+    """
+    bolt_coords = np.asarray(bolt_coords, dtype=float)
+    Fx, Fy, Mz, x_loc, y_loc = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(a, dtype=float)) for a in (Fx, Fy, Mz, x_loc, y_loc))
+    )
+    n = len(bolt_coords)
+
+    centroid = np.mean(bolt_coords, axis=0)
+    rel_coords = bolt_coords - centroid
+    Ip = float(np.vdot(rel_coords, rel_coords))
+
+    # Moment about the centroid for every case, shape (L,)
+    Mz_total = Mz + (x_loc - centroid[0]) * Fy - (y_loc - centroid[1]) * Fx
+
+    bolt_forces_x = np.repeat((Fx / n)[:, None], n, axis=1)
+    bolt_forces_y = np.repeat((Fy / n)[:, None], n, axis=1)
+    if Ip > 1e-12:
+        k = (Mz_total / Ip)[:, None]
+        bolt_forces_x -= k * rel_coords[:, 1]
+        bolt_forces_y += k * rel_coords[:, 0]
+
+    return bolt_forces_x, bolt_forces_y
+
+
+if __name__ == "__main__":
+    # --- Example Usage ---
+    bolts = np.array([[0, 0], [3, 0], [0, 3], [3, 3]])
+    # Fx=10 kip, Fy=0, Mz=50 kip-in, applied at x=6, y=1.5
+    results = solve_bolt_elastic(bolts, Fx=10, Fy=0, Mz=50, x_loc=6, y_loc=1.5)
+    print(results)
@@ -1,4 +1,5 @@
 import math
+from functools import partial
 import numpy as np
 from typing import Callable, Sequence
 
@@ -11,37 +12,73 @@ def nelder_mead_2d(
     step: float = 1.0,
     tol: float = 1e-8,
     max_iter: int = 500,
+    max_stall: int = 100,
 ) -> tuple[np.ndarray, float]:
     """
     Very small Nelder–Mead for 2D (no scipy).
     Minimizes scalar f(x,y) where x,y are floats.
+
+    Besides the size/spread test, stops early when the best value has not
+    improved (relative to `tol`) for `max_stall` iterations, or when the
+    simplex has collapsed onto a line and can no longer move in 2D.
     """
     x0 = np.asarray(x0, dtype=float)
 
     # Initial simplex: x0, x0+[step,0], x0+[0,step]
-    simplex = np.array([x0, x0 + [step, 0.0], x0 + [0.0, step]], dtype=float)
-    vals = np.array([f(p) for p in simplex], dtype=float)
+    # Kept as a list of three points so reordering is a tuple swap rather than
+    # an argsort plus a fancy-indexed copy of the whole simplex.
+    simplex = [x0, x0 + (step, 0.0), x0 + (0.0, step)]
+    vals = [f(p) for p in simplex]
 
-    # Coeffs
+    # Coeffs. The Gao-Han "adaptive" values (1, 1 + 2/n, 0.75 - 1/2n, 1 - 1/n)
+    # reduce to exactly the standard ones for n = 2, so there is nothing to adapt.
     alpha = 1.0   # reflection
     gamma = 2.0   # expansion
     rho   = 0.5   # contraction
     sigma = 0.5   # shrink
 
+    def order() -> None:
+        # 3-element sorting network; strict compares keep it stable.
+        if vals[2] < vals[1]:
+            simplex[1], simplex[2] = simplex[2], simplex[1]
+            vals[1], vals[2] = vals[2], vals[1]
+        if vals[1] < vals[0]:
+            simplex[0], simplex[1] = simplex[1], simplex[0]
+            vals[0], vals[1] = vals[1], vals[0]
+        if vals[2] < vals[1]:
+            simplex[1], simplex[2] = simplex[2], simplex[1]
+            vals[1], vals[2] = vals[2], vals[1]
+
+    best_seen = min(vals)
+    stall = 0
+
     for _ in range(max_iter):
-        # Order
-        order = np.argsort(vals)
-        simplex = simplex[order]
-        vals = vals[order]
+        # Order (only the replaced vertex moves, except after a shrink)
+        order()
 
-        best = simplex[0]
-        worst = simplex[-1]
+        best, mid, worst = simplex
 
         # Convergence: simplex size + function spread
-        if np.max(np.linalg.norm(simplex - best, axis=1)) < tol and (vals[-1] - vals[0]) < tol:
+        e1 = mid - best
+        e2 = worst - best
+        size = max(math.hypot(*e1), math.hypot(*e2))
+        if size < tol and (vals[2] - vals[0]) < tol:
+            break
+
+        # Stagnation: no relative progress on the best vertex for a while
+        if vals[0] < best_seen - tol * abs(best_seen):
+            best_seen = vals[0]
+            stall = 0
+        else:
+            stall += 1
+            if stall >= max_stall:
+                break
+
+        # Degenerate simplex: area negligible against its size
+        if abs(e1[0] * e2[1] - e1[1] * e2[0]) <= 1e-12 * size * size:
             break
 
-        centroid = np.mean(simplex[:-1], axis=0)
+        centroid = (best + mid) / 2
 
         # Reflect
         xr = centroid + alpha * (centroid - worst)
@@ -52,17 +89,17 @@ def nelder_mead_2d(
             xe = centroid + gamma * (xr - centroid)
             fe = f(xe)
             if fe < fr:
-                simplex[-1], vals[-1] = xe, fe
+                simplex[2], vals[2] = xe, fe
             else:
-                simplex[-1], vals[-1] = xr, fr
+                simplex[2], vals[2] = xr, fr
             continue
 
-        if fr < vals[-2]:
-            simplex[-1], vals[-1] = xr, fr
+        if fr < vals[1]:
+            simplex[2], vals[2] = xr, fr
             continue
 
         # Contract
-        if fr < vals[-1]:
+        if fr < vals[2]:
             # outside contraction
             xc = centroid + rho * (xr - centroid)
         else:
@@ -70,43 +107,211 @@ def nelder_mead_2d(
             xc = centroid - rho * (centroid - worst)
         fc = f(xc)
 
-        if fc < vals[-1]:
-            simplex[-1], vals[-1] = xc, fc
+        if fc < vals[2]:
+            simplex[2], vals[2] = xc, fc
             continue
 
         # Shrink
-        for i in range(1, len(simplex)):
+        for i in (1, 2):
             simplex[i] = best + sigma * (simplex[i] - best)
             vals[i] = f(simplex[i])
 
-    order = np.argsort(vals)
-    return simplex[order][0], float(vals[order][0])
+    order()
+    return simplex[0], float(vals[0])
 
 
-# ----------------------------
-# PATCH: replace _calculate_final_state
-# ----------------------------
-def _calculate_final_state(
-    bolt_coords: np.ndarray,
+def levenberg_marquardt_2d(
+    r: Callable[[np.ndarray], tuple[float, ...]],
+    x0: Sequence[float] | np.ndarray,
+    scale: float = 1.0,
+    tol: float = 1e-8,
+    max_iter: int = 50,
+    max_step: float = 10.0,
+) -> tuple[np.ndarray, float]:
+    """
+    Small Levenberg–Marquardt for 2 unknowns (no scipy).
+    Minimizes sum(r(x,y)**2) for a residual vector r, using a forward-difference
+    Jacobian with steps relative to `scale` (a characteristic length).
+    Each step is capped at `max_step * scale`, so a near-singular Jacobian
+    cannot throw the iterate far from the region it was started in.
+    Stops when the accepted step is shorter than `tol`.
+    """
+    x = np.array(x0, dtype=float)
+    res = np.array(r(x))
+    f = float(res @ res)
+    damping = 1e-3
+    h = 1e-7 * max(scale, 1.0)
+    step_cap = max_step * max(scale, 1.0)
+
+    for _ in range(max_iter):
+        J = np.empty((len(res), 2))
+        J[:, 0] = (np.array(r(x + (h, 0.0))) - res) / h
+        J[:, 1] = (np.array(r(x + (0.0, h))) - res) / h
+        JtJ = J.T @ J
+        g = J.T @ res
+
+        # Raise the damping until a step reduces the sum of squares
+        while damping < 1e12:
+            a = JtJ[0, 0] * (1.0 + damping)
+            d = JtJ[1, 1] * (1.0 + damping)
+            b = JtJ[0, 1]
+            det = a * d - b * b
+            if det > 0.0:
+                dx = (-d * g[0] + b * g[1]) / det
+                dy = (b * g[0] - a * g[1]) / det
+                length = math.hypot(dx, dy)
+                if length > step_cap:
+                    dx *= step_cap / length
+                    dy *= step_cap / length
+                x_new = x + (dx, dy)
+                res_new = np.array(r(x_new))
+                f_new = float(res_new @ res_new)
+                if f_new < f:
+                    break
+            damping *= 10.0
+        else:
+            break
+
+        x, res, f = x_new, res_new, f_new
+        damping = max(damping / 10.0, 1e-12)
+        if math.hypot(dx, dy) < tol:
+            break
+
+    return x, f
+
+
+def _halton_2d(n: int) -> np.ndarray:
+    """First n points of the 2D Halton sequence (bases 2 and 3) in [0, 1)^2."""
+    out = np.empty((n, 2))
+    for col, base in enumerate((2, 3)):
+        for i in range(n):
+            f, r, k = 1.0, 0.0, i + 1
+            while k > 0:
+                f /= base
+                r += f * (k % base)
+                k //= base
+            out[i, col] = r
+    return out
+
+
+# Low-discrepancy seed pattern for the ICR multi-start, shared by all solves
+_SEED_PATTERN = 2.0 * _halton_2d(32) - 1.0
+
+
+# Seeds tried in score order before settling for the best plausible ICR
+_MAX_REFINE_SEEDS = 4
+
+
+# Below this many bolts a plain-Python loop over `math` beats the ~15 NumPy
+# calls of the array kernel, whose cost is per-call overhead at small N.
+_SCALAR_KERNEL_MAX_BOLTS = 16
+
+
+def _icr_kernel_scalar(
+    bolt_x: np.ndarray, bolt_y: np.ndarray, x_ic: float, y_ic: float, mu: float, lam: float, delta_max: float
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, float, float, float]:
+    """Fused single-pass version of `_icr_kernel_arrays` for small bolt groups."""
+    rxs = []
+    rys = []
+    dists = []
+    c_max = 0.0
+    for x, y in zip(bolt_x.tolist(), bolt_y.tolist()):
+        rx = x - x_ic
+        ry = y - y_ic
+        d = math.sqrt(max(rx * rx + ry * ry, 1e-18))
+        rxs.append(rx)
+        rys.append(ry)
+        dists.append(d)
+        if d > c_max:
+            c_max = d
+
+    k = -mu / max(delta_max, c_max)
+    ws = []
+    V_int_x = V_int_y = M_int_mag = 0.0
+    for rx, ry, d in zip(rxs, rys, dists):
+        Ri = (-math.expm1(k * d)) ** lam
+        w = Ri / d
+        ws.append(w)
+        V_int_x -= w * ry
+        V_int_y += w * rx
+        M_int_mag += Ri * d
+
+    return np.array(ws), np.array(rxs), np.array(rys), V_int_x, V_int_y, M_int_mag
+
+
+def _icr_sums_scalar(
+    bolt_x: Sequence[float], bolt_y: Sequence[float], x_ic: float, y_ic: float, mu: float, lam: float, delta_max: float
+) -> tuple[float, float, float]:
+    """
+    Only the unit-scale sums (V_int_x, V_int_y, M_int_mag) of
+    `_icr_kernel_scalar`, for the objective. Takes the coordinates as plain
+    lists of floats and builds no per-bolt arrays.
+    """
+    rxs = [x - x_ic for x in bolt_x]
+    rys = [y - y_ic for y in bolt_y]
+    dists = [math.sqrt(max(rx * rx + ry * ry, 1e-18)) for rx, ry in zip(rxs, rys)]
+
+    k = -mu / max(delta_max, max(dists))
+    V_int_x = V_int_y = M_int_mag = 0.0
+    for rx, ry, d in zip(rxs, rys, dists):
+        Ri = (-math.expm1(k * d)) ** lam
+        w = Ri / d
+        V_int_x -= w * ry
+        V_int_y += w * rx
+        M_int_mag += Ri * d
+
+    return V_int_x, V_int_y, M_int_mag
+
+
+def _icr_sums_arrays(
+    bolt_x: np.ndarray,
+    bolt_y: np.ndarray,
     x_ic: float,
     y_ic: float,
-    Fx: float,
-    Fy: float,
-    Mz_total: float,
     mu: float,
     lam: float,
     delta_max: float,
-) -> tuple[np.ndarray, np.ndarray, tuple[float, float]]:
-    """
-    Computes bolt forces for a given ICR.
-    Handles pure torsion (P ~ 0) by scaling to match moment instead of shear.
+    workspace: tuple[np.ndarray, ...] | None = None,
+) -> tuple[float, float, float]:
+    """The unit-scale sums (V_int_x, V_int_y, M_int_mag) of `_icr_kernel_arrays`."""
+    return _icr_kernel_arrays(bolt_x, bolt_y, x_ic, y_ic, mu, lam, delta_max, workspace)[3:]
+
+
+def _icr_kernel_arrays(
+    bolt_x: np.ndarray,
+    bolt_y: np.ndarray,
+    x_ic: float,
+    y_ic: float,
+    mu: float,
+    lam: float,
+    delta_max: float,
+    workspace: tuple[np.ndarray, ...] | None = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, float, float, float]:
     """
-    bolt_coords = np.asarray(bolt_coords, dtype=float)
-    r_vecs = bolt_coords - np.array([x_ic, y_ic], dtype=float)
+    Crawford-Kulak response about an ICR with unit scale.
 
-    dist_i = np.linalg.norm(r_vecs, axis=1)
-    dist_i = np.where(dist_i < 1e-9, 1e-9, dist_i)
-    c_max = float(np.max(dist_i))
+    Takes the bolt coordinates as two contiguous columns (bolt_x, bolt_y).
+    Returns (w, rx, ry, V_int_x, V_int_y, M_int_mag) where bolt i carries the
+    force w[i] * (-ry[i], rx[i]).
+
+    `workspace` is an optional set of five N-length buffers (see
+    `_icr_workspace`) written in place; the returned arrays then alias it and
+    are only valid until the next call with the same workspace.
+    """
+    if workspace is None:
+        workspace = _icr_workspace(len(bolt_x))
+    rx, ry, dist_i, Ri, w = workspace
+    np.subtract(bolt_x, x_ic, out=rx)
+    np.subtract(bolt_y, y_ic, out=ry)
+
+    # Work in place on a few buffers instead of allocating a temporary per
+    # elementwise step.
+    np.multiply(rx, rx, out=dist_i)
+    np.multiply(ry, ry, out=w)
+    dist_i += w
+    np.maximum(dist_i, 1e-18, out=dist_i)
+    np.sqrt(dist_i, out=dist_i)
+    c_max = float(dist_i.max())
 
     # IMPORTANT:
     # `delta_max` must be in the same length units as `bolt_coords`.
@@ -119,47 +324,76 @@ def _calculate_final_state(
     # To keep the solver unit-agnostic, we clamp `delta_max` to at least `c_max`
     # (same units as coordinates).
     delta_eff = float(max(delta_max, c_max))
-    Ri = (1.0 - np.exp(-mu * (dist_i / delta_eff))) ** lam
+    # Crawford-Kulak over all bolts at once; 1 - e^(-x) as -expm1(-x), with the
+    # scalar factor folded so only one full-array multiply is needed.
+    np.multiply(dist_i, -mu / delta_eff, out=Ri)
+    np.expm1(Ri, out=Ri)
+    np.negative(Ri, out=Ri)
+    np.power(Ri, lam, out=Ri)
 
-    # CCW tangential unit vectors
-    tx = -r_vecs[:, 1] / dist_i
-    ty =  r_vecs[:, 0] / dist_i
+    # Ri times the CCW tangential unit vector (-ry, rx) / dist is w * (-ry, rx);
+    # the sums reduce with dot products instead of building tx, ty and Ri * t.
+    np.divide(Ri, dist_i, out=w)
 
-    V_int_x = float(np.sum(Ri * tx))
-    V_int_y = float(np.sum(Ri * ty))
-    V_int_sq = V_int_x * V_int_x + V_int_y * V_int_y
-    V_int_mag = math.sqrt(V_int_sq)
+    # Moment “capacity” per unit scale about the ICR:
+    return w, rx, ry, -float(w @ ry), float(w @ rx), float(Ri @ dist_i)
 
-    P = math.hypot(Fx, Fy)
 
-    # Moment “capacity” per unit scale about the ICR:
-    M_int_mag = float(np.sum(Ri * dist_i))
+def _icr_workspace(n: int) -> tuple[np.ndarray, ...]:
+    """Scratch buffers (rx, ry, dist, Ri, w) for `_icr_kernel_arrays`."""
+    return tuple(np.empty(n) for _ in range(5))
+
+
+# ----------------------------
+# PATCH: replace _calculate_final_state
+# ----------------------------
+def _calculate_final_state(
+    bolt_coords: np.ndarray,
+    x_ic: float,
+    y_ic: float,
+    Fx: float,
+    Fy: float,
+    Mz_total: float,
+    mu: float,
+    lam: float,
+    delta_max: float,
+) -> tuple[np.ndarray, np.ndarray, tuple[float, float]]:
+    """
+    Computes bolt forces for a given ICR.
+    Handles pure torsion (P ~ 0) by scaling to match moment instead of shear.
+    """
+    bolt_coords = np.asarray(bolt_coords, dtype=float)
+    bolt_x = np.ascontiguousarray(bolt_coords[:, 0])
+    bolt_y = np.ascontiguousarray(bolt_coords[:, 1])
+    kernel = _icr_kernel_scalar if len(bolt_coords) <= _SCALAR_KERNEL_MAX_BOLTS else _icr_kernel_arrays
+    w, rx, ry, V_int_x, V_int_y, M_int_mag = kernel(bolt_x, bolt_y, x_ic, y_ic, mu, lam, delta_max)
+    w *= _signed_scale(V_int_x, V_int_y, M_int_mag, Fx, Fy, Mz_total)
+    return -w * ry, w * rx, (float(x_ic), float(y_ic))
+
+
+def _signed_scale(
+    V_int_x: float, V_int_y: float, M_int_mag: float, Fx: float, Fy: float, Mz_total: float
+) -> float:
+    """
+    Signed multiplier on the unit-scale kernel response (w) that matches the
+    applied shear, or the applied torsion when P ~ 0.
+    """
+    P = math.hypot(Fx, Fy)
 
     if P < 1e-12:
         # Pure torsion: pick scale so internal moment matches Mz_total
         if M_int_mag < 1e-12:
-            scale = 0.0
-        else:
-            scale = abs(Mz_total) / M_int_mag
-        rot_sign = 1.0 if Mz_total >= 0 else -1.0
-        bolt_forces_x = Ri * tx * scale * rot_sign
-        bolt_forces_y = Ri * ty * scale * rot_sign
-        return bolt_forces_x, bolt_forces_y, (float(x_ic), float(y_ic))
+            return 0.0
+        scale = abs(Mz_total) / M_int_mag
+        return scale if Mz_total >= 0 else -scale
 
+    V_int_mag = math.hypot(V_int_x, V_int_y)
     if V_int_mag < 1e-12:
-        return np.zeros(len(bolt_coords)), np.zeros(len(bolt_coords)), (float(x_ic), float(y_ic))
-
+        return 0.0
 
     # match magnitude, then choose sign to align with applied
     scale = P / V_int_mag
-    rot_sign = 1.0
-    dot = (V_int_x * Fx + V_int_y * Fy) / (V_int_mag * P)
-    if dot < 0.0:
-        rot_sign = -1.0
-
-    bolt_forces_x = Ri * tx * scale * rot_sign
-    bolt_forces_y = Ri * ty * scale * rot_sign
-    return bolt_forces_x, bolt_forces_y, (float(x_ic), float(y_ic))
+    return -scale if V_int_x * Fx + V_int_y * Fy < 0.0 else scale
 
 
 def solve_bolt_icr(
@@ -173,10 +407,27 @@ def solve_bolt_icr(
     lam: float = 0.55,
     delta_max: float = 8.64,
     tolerance: float = 1e-6,
+    icr_guess: tuple[float, float] | None = None,
 ) -> tuple[np.ndarray, np.ndarray, tuple[float, float, int]]:
-    bolt_coords = np.array(bolt_coords, dtype=float)
-    centroid = np.mean(bolt_coords, axis=0)
-    Cx, Cy = float(centroid[0]), float(centroid[1])
+    """
+    Solve bolt forces by the instantaneous centre of rotation method.
+
+    `icr_guess` optionally warm-starts the search (e.g. the ICR of a nearby
+    load case); it is only trusted when it already nearly satisfies
+    equilibrium, otherwise the usual multi-start search runs.
+    """
+    # Read-only use, so no defensive copy of an existing float array.
+    bolt_coords = np.asarray(bolt_coords, dtype=float)
+
+    # Bolt geometry as two contiguous columns for the kernels (strided
+    # bolt_coords[:, 0] views would be re-sliced on every evaluation)
+    bolt_x = np.ascontiguousarray(bolt_coords[:, 0])
+    bolt_y = np.ascontiguousarray(bolt_coords[:, 1])
+
+    # Centroid straight to Python floats (captured by the objectives below)
+    inv_n = 1.0 / len(bolt_coords)
+    Cx = float(bolt_x.sum()) * inv_n
+    Cy = float(bolt_y.sum()) * inv_n
 
     # Moment transfer to centroid
     Mz_centroid = Mz + (x_loc - Cx) * Fy - (y_loc - Cy) * Fx
@@ -186,70 +437,219 @@ def solve_bolt_icr(
     P = math.hypot(Fx, Fy)
 
     # Characteristic length for nondimensional residuals
-    L_char = float(np.max(np.linalg.norm(bolt_coords - np.array([Cx, Cy]), axis=1)))
-    force_scale = max(P, 1.0)
+    L_char = float(np.hypot(bolt_x - Cx, bolt_y - Cy).max())
+    Ip = float(np.vdot(bolt_x - Cx, bolt_x - Cx) + np.vdot(bolt_y - Cy, bolt_y - Cy))
+    # Under pure torsion there is no applied shear to scale by; use the force
+    # the moment develops at the group's radius so the force residual does not
+    # swamp the moment residual and pull the ICR out to infinity.
+    force_scale = max(P if P >= 1e-12 else abs(Mz_centroid) / max(L_char, 1e-9), 1.0)
     moment_scale = max(abs(Mz_centroid), 1.0)
-
-    def moment_about_centroid(bfx, bfy):
-        r = bolt_coords - np.array([Cx, Cy], dtype=float) # relative to centroid
-        return float(np.sum(r[:, 0] * bfy - r[:, 1] * bfx)) # moment about centroid (sum of all bolt moments)
+    # Squared inverse residual weights, fixed for the whole solve
+    inv_fs2 = 1.0 / force_scale ** 2
+    inv_ms2 = (max(L_char, 1e-9) / moment_scale) ** 2
+
+    # The objectives only need the kernel's sums: icr_sums(x_ic, y_ic, ...)
+    if len(bolt_coords) <= _SCALAR_KERNEL_MAX_BOLTS:
+        icr_sums = partial(_icr_sums_scalar, bolt_x.tolist(), bolt_y.tolist())
+    else:
+        # One set of scratch buffers reused by every objective evaluation; the
+        # objective only keeps the scalar sums, never the aliased arrays.
+        icr_sums = partial(_icr_sums_arrays, bolt_x, bolt_y, workspace=_icr_workspace(len(bolt_coords)))
 
     def objective_xy(xy):
         """
         Objective function to minimize. Returns a residual value.
+
+        Works from the kernel's unit-scale sums: with bolt forces k * w * (-ry, rx),
+        the force sums are k * V_int and the moment about the ICR is k * M_int.
+        The moment about the centroid transfers from the ICR,
+        k * (M_int + (ICR - C) x V_int), so no further pass over the bolts is needed.
         """
         x_ic, y_ic = float(xy[0]), float(xy[1])
-        bfx, bfy, _ = _calculate_final_state(
-            bolt_coords, x_ic, y_ic, Fx, Fy, Mz_centroid, mu, lam, delta_max
-        )
-        dFx = float(np.sum(bfx) - Fx)
-        dFy = float(np.sum(bfy) - Fy)
-        dMz = float(moment_about_centroid(bfx, bfy) - Mz_centroid)
+        V_int_x, V_int_y, M_int_mag = icr_sums(x_ic, y_ic, mu, lam, delta_max)
+        k = _signed_scale(V_int_x, V_int_y, M_int_mag, Fx, Fy, Mz_centroid)
+        dFx = k * V_int_x - Fx
+        dFy = k * V_int_y - Fy
+        dMz = k * (M_int_mag + (x_ic - Cx) * V_int_y - (y_ic - Cy) * V_int_x) - Mz_centroid
 
         # nondimensional weighted SSE
-        return (dFx / force_scale) ** 2 + (dFy / force_scale) ** 2 + (dMz / (moment_scale / max(L_char, 1e-9))) ** 2
+        return (dFx * dFx + dFy * dFy) * inv_fs2 + dMz * dMz * inv_ms2
 
+    inv_fs = math.sqrt(inv_fs2)
+    inv_ms = math.sqrt(inv_ms2)
+
+    def residuals_xy(xy):
+        """The weighted residuals (dFx, dFy, dMz) whose squares sum to `objective_xy`."""
+        x_ic, y_ic = float(xy[0]), float(xy[1])
+        V_int_x, V_int_y, M_int_mag = icr_sums(x_ic, y_ic, mu, lam, delta_max)
+        k = _signed_scale(V_int_x, V_int_y, M_int_mag, Fx, Fy, Mz_centroid)
+        return (
+            (k * V_int_x - Fx) * inv_fs,
+            (k * V_int_y - Fy) * inv_fs,
+            (k * (M_int_mag + (x_ic - Cx) * V_int_y - (y_ic - Cy) * V_int_x) - Mz_centroid) * inv_ms,
+        )
+
+    def objective_batch(xy):
+        """
+        `objective_xy` for K trial ICRs at once; xy is (K, 2), returns (K,).
+        Broadcasts the kernel over (K, N) so each ufunc runs once for all seeds.
+        """
+        rx = bolt_x - xy[:, 0:1]
+        ry = bolt_y - xy[:, 1:2]
+        dist = np.sqrt(np.maximum(rx * rx + ry * ry, 1e-18))
+        delta_eff = np.maximum(delta_max, dist.max(axis=1, keepdims=True))
+        Ri = (-np.expm1((-mu / delta_eff) * dist)) ** lam
+        w = Ri / dist
+
+        V_int_x = -(w * ry).sum(axis=1)
+        V_int_y = (w * rx).sum(axis=1)
+        M_int_mag = (Ri * dist).sum(axis=1)
+        M_cent = M_int_mag + (xy[:, 0] - Cx) * V_int_y - (xy[:, 1] - Cy) * V_int_x
+
+        k = np.array([
+            _signed_scale(vx, vy, m, Fx, Fy, Mz_centroid)
+            for vx, vy, m in zip(V_int_x.tolist(), V_int_y.tolist(), M_int_mag.tolist())
+        ])
+        dFx = k * V_int_x - Fx
+        dFy = k * V_int_y - Fy
+        dMz = k * M_cent - Mz_centroid
+        return (dFx * dFx + dFy * dFy) * inv_fs2 + dMz * dMz * inv_ms2
+
+
+    def refine(xy0, step):
+        """
+        Local solve from a seed: Levenberg–Marquardt on the residual vector
+        (quadratic convergence, ~10-20 evaluations), falling back to
+        Nelder–Mead when it does not reach `tolerance` (e.g. across a sign
+        flip of the scale, where the residuals are not smooth). LM can stall
+        in a poor basin there, so the fallback runs from both the seed and the
+        LM iterate and keeps the lower objective.
+        """
+        xy_star, f_star = levenberg_marquardt_2d(residuals_xy, xy0, scale=L_char, tol=tolerance)
+        if f_star <= tolerance:
+            return xy_star, f_star
+        return min(
+            (nelder_mead_2d(objective_xy, start, step=step, tol=tolerance, max_iter=800) for start in (xy0, xy_star)),
+            key=lambda result: result[1],
+        )
 
     def solve_2d():
         """
         Solve for the ICR using
-        1. A rough search around the controid
-        2. Refined search 2D Nelder–Mead solver.
+        1. `icr_guess`, when given and already close, refined directly
+        2. Otherwise a batched scan of seeds around the centroid
+        3. `refine` from the best seed: Levenberg–Marquardt, then
+           Nelder–Mead if LM does not converge.
         """
-        # Coarse multi-start around centroid to avoid bad simplex starts
-
-        # Search radius based on required lever arm ~ |Mz|/P (clamped)
-        r_req = abs(Mz_centroid) / max(P, 1e-9)
-        R = max(0.5 * L_char, min(5.0 * L_char, r_req if np.isfinite(r_req) else 2.0 * L_char))
-
-        candidates = [np.array([Cx, Cy], dtype=float)]
-        # add a small ring of candidates
-        for ang in np.linspace(0.0, 2.0 * math.pi, 12, endpoint=False):
-            candidates.append(np.array([Cx + R * math.cos(ang), Cy + R * math.sin(ang)], dtype=float))
-        # include centroid too
-        candidates.append(np.array([Cx, Cy], dtype=float))
+        # Warm start: a good guess only needs a short local refinement
+        if icr_guess is not None:
+            guess = np.array(icr_guess, dtype=float)
+            if objective_xy(guess) < 10.0 * tolerance:
+                xy_star, f_star = refine(guess, step=0.05 * max(L_char, 1.0))
+                if f_star <= tolerance:
+                    return _calculate_final_state(
+                        bolt_coords, float(xy_star[0]), float(xy_star[1]),
+                        Fx, Fy, Mz_centroid, mu, lam, delta_max,
+                    )
+
+        # Elastic-method ICR, the point where the elastic bolt force vanishes:
+        # C + Ip / (n * Mc) * (-Fy, Fx). It is the centroid for pure torsion
+        # and recedes to infinity as Mc -> 0; its distance also sets how far
+        # from the centroid an ICR result is still plausible.
+        if abs(Mz_centroid) > 1e-12:
+            c_el = Ip / (len(bolt_x) * Mz_centroid)
+            elastic_xy = (Cx - c_el * Fy, Cy + c_el * Fx)
+            r_max = 10.0 * max(L_char, abs(c_el) * P)
+        else:
+            elastic_xy = None
+            r_max = math.inf
 
-        best_xy = None
-        best_f = float("inf")
-        for c in candidates:
-            fc = objective_xy(c)
-            if fc < best_f:
-                best_f, best_xy = fc, c
+        # Coarse multi-start around centroid to avoid bad simplex starts
 
-        step = 0.25 * max(L_char, 1.0)
-        xy_star, _ = nelder_mead_2d(objective_xy, best_xy, step=step, tol=tolerance, max_iter=800)
+        # Search radius based on required lever arm ~ |Mz|/P (clamped). Under
+        # pure torsion the ICR stays within the group, so keep seeds close.
+        if P < 1e-12:
+            R = L_char
+        else:
+            r_req = abs(Mz_centroid) / P
+            R = max(0.5 * L_char, min(5.0 * L_char, r_req))
+
+        # centroid, the elastic ICR, and Halton points over the square
+        # [C - R, C + R]^2; unlike a single-radius ring these cover the radial
+        # direction as well
+        candidates = [(Cx, Cy)] + ([elastic_xy] if elastic_xy is not None else [])
+        candidates = np.vstack([candidates, (Cx, Cy) + R * _SEED_PATTERN])
+        candidates = candidates[np.hypot(candidates[:, 0] - Cx, candidates[:, 1] - Cy) <= r_max]
+
+        # score all seeds in one batched evaluation, then refine from the best;
+        # a result that runs away beyond r_max (the objective can keep falling
+        # towards an ICR at infinity) or misses tolerance moves on to the next
+        # seed, keeping the best plausible result
+        best = None
+        for i in np.argsort(objective_batch(candidates), kind="stable")[:_MAX_REFINE_SEEDS]:
+            xy_star, f_star = refine(candidates[i], step=0.25 * max(L_char, 1.0))
+            if math.hypot(xy_star[0] - Cx, xy_star[1] - Cy) > r_max:
+                continue
+            if best is None or f_star < best[1]:
+                best = (xy_star, f_star)
+            if f_star <= tolerance:
+                break
+        xy_star = candidates[0] if best is None else best[0]
 
         return _calculate_final_state(
             bolt_coords, float(xy_star[0]), float(xy_star[1]),
             Fx, Fy, Mz_centroid, mu, lam, delta_max,
         )
 
-    # auto: run 1D, check residual, then 2D if needed
+    # seed (or warm start), then LM refinement with Nelder–Mead fallback
     bfx, bfy, icr = solve_2d()
 
     return bfx, bfy, icr
 
 
+def solve_bolt_icr_batch(
+    bolt_coords: np.ndarray,
+    Fx: np.ndarray,
+    Fy: np.ndarray,
+    Mz: np.ndarray,
+    x_loc: np.ndarray,
+    y_loc: np.ndarray,
+    mu: float = 10.0,
+    lam: float = 0.55,
+    delta_max: float = 8.64,
+    tolerance: float = 1e-6,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    ICR method for many load cases on one bolt pattern.
+
+    Same conventions as `solve_bolt_icr`, with each load argument an array of
+    length L. Cases are solved in order, each warm-started from the previous
+    case's ICR, so sweeps over similar loads mostly skip the seeded search.
+
+    Returns:
+    (forces_x, forces_y, icr): the forces shaped (L, N) with row l for load
+    case l, and the ICR points shaped (L, 2).
+    """
+    bolt_coords = np.asarray(bolt_coords, dtype=float)
+    Fx, Fy, Mz, x_loc, y_loc = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(a, dtype=float)) for a in (Fx, Fy, Mz, x_loc, y_loc))
+    )
+    n_cases = len(Fx)
+
+    forces_x = np.empty((n_cases, len(bolt_coords)))
+    forces_y = np.empty((n_cases, len(bolt_coords)))
+    icr = np.empty((n_cases, 2))
+    guess = None
+    for l in range(n_cases):
+        forces_x[l], forces_y[l], guess = solve_bolt_icr(
+            bolt_coords, float(Fx[l]), float(Fy[l]), float(Mz[l]), float(x_loc[l]), float(y_loc[l]),
+            mu=mu, lam=lam, delta_max=delta_max, tolerance=tolerance, icr_guess=guess,
+        )
+        icr[l] = guess
+
+    return forces_x, forces_y, icr
+
+
 def check_icr(bolt_forces_x, bolt_forces_y, icr_point, bolt_coords, Fx, Fy, Mz_centroid) -> None:
     """
     Verifies that the calculated bolt forces satisfy equilibrium with the 
@@ -278,13 +678,8 @@ def check_icr(bolt_forces_x, bolt_forces_y, icr_point, bolt_coords, Fx, Fy, Mz_c
     
     # 3. Geometric Check: Perpendicularity
     icr_x, icr_y = icr_point
-    r_vecs = bolt_coords - np.array([icr_x, icr_y])
-    
-    dot_products = []
-    for i in range(len(bolt_coords)):
-        force_vec = np.array([bolt_forces_x[i], bolt_forces_y[i]])
-        dot = np.dot(r_vecs[i], force_vec)
-        dot_products.append(dot)
+    dot_products = (bolt_coords[:, 0] - icr_x) * bolt_forces_x + \
+                   (bolt_coords[:, 1] - icr_y) * bolt_forces_y
     
     max_dot = np.max(np.abs(dot_products))
     print(f"{'Max Perp Err':<12} | {'0.0':<12} | {max_dot:<12.4e} | (Radial Dot Product)")
@@ -319,8 +714,7 @@ def main():
         return Mz_centroid + (Cx - x0) * Fy - (Cy - y0) * Fx
 
     def internal_moment_about_point(x0, y0, bolt_coords, bolt_fx, bolt_fy):
-        r = bolt_coords - np.array([x0, y0], dtype=float)
-        return float(np.sum(r[:, 0] * bolt_fy - r[:, 1] * bolt_fx))
+        return float((bolt_coords[:, 0] - x0) @ bolt_fy - (bolt_coords[:, 1] - y0) @ bolt_fx)
 
     def rank_corr(x, y):
         # small, dependency-free Spearman-like correlation via ranks
@@ -359,7 +753,7 @@ def main():
         Mappl_icr = applied_moment_about_point(icr_x, icr_y, Fx, Fy, Mz_centroid, Cx, Cy)
 
         # Per-bolt reasonableness metrics
-        r_to_icr = np.linalg.norm(bolt_coords - np.array([icr_x, icr_y]), axis=1)
+        r_to_icr = np.hypot(bolt_coords[:, 0] - icr_x, bolt_coords[:, 1] - icr_y)
         shear_mag = np.hypot(bolt_fx, bolt_fy)
 
         order = np.argsort(r_to_icr)
@@ -395,9 +789,14 @@ def main():
         print("\n-- Per-bolt (sorted by radius to ICR) --")
         print(f"{'i':>2} | {'x':>9} {'y':>9} | {'r_to_icr':>10} | {'|V_i|':>10} | {'Fx_i':>10} {'Fy_i':>10}")
         print("-" * 88)
-        for k, idx in enumerate(order):
-            x, y = bolt_coords[idx]
-            print(f"{idx:2d} | {x:9.4f} {y:9.4f} | {r_to_icr[idx]:10.4f} | {shear_mag[idx]:10.6f} | {bolt_fx[idx]:10.6f} {bolt_fy[idx]:10.6f}")
+        # one print for the whole table rather than one per bolt
+        print("\n".join(
+            f"{idx:2d} | {x:9.4f} {y:9.4f} | {r:10.4f} | {v:10.6f} | {fx:10.6f} {fy:10.6f}"
+            for idx, (x, y), r, v, fx, fy in zip(
+                order.tolist(), bolt_coords[order].tolist(), r_sorted.tolist(),
+                s_sorted.tolist(), bolt_fx[order].tolist(), bolt_fy[order].tolist(),
+            )
+        ))
 
         print("\n-- Radius vs shear trend --")
         print(f"Linear corr(r,|V|) = {corr_lin:+.4f}")
@@ -25,6 +25,7 @@ class ICRSearchConfig:
     max_iterations: int = 100
     tolerance: float = 1e-6
     min_candidates: int = 60
+    newton_iterations: int = 8
     refine_bisection: bool = True
     bisection_iterations: int = 20
 
@@ -117,9 +118,12 @@ def find_icr_distance(
     """
     Find ICR distance that satisfies moment-shear equilibrium.
     
-    Uses a two-phase approach:
+    Tries a Newton fast path first: starting from the eccentricity, up to
+    `config.newton_iterations` steps using a forward-difference slope. If
+    that does not converge (or stops reducing the residual), falls back to:
     1. Coarse search with logarithmic spacing to find bracket
-    2. Bisection refinement within bracket
+    2. Brent's method refinement within bracket (at most
+       `config.bisection_iterations` further evaluations)
     
     Args:
         evaluate_fn: Function(distance) -> (ratio, data_dict) or None
@@ -134,6 +138,49 @@ def find_icr_distance(
     """
     ratio_tolerance = config.tolerance * max(1.0, abs(target_ratio))
     
+    best_result: dict | None = None
+    best_distance = 0.0
+    best_error = float("inf")
+    
+    # Phase 0: Newton fast path (ratio(d) is smooth and usually monotone)
+    dist = min(max(eccentricity, dist_min), dist_max)
+    prev_error = float("inf")
+    for _ in range(config.newton_iterations):
+        eval_result = evaluate_fn(dist)
+        if eval_result is None:
+            break
+        
+        ratio, data = eval_result
+        residual = ratio - target_ratio
+        error = abs(residual)
+        
+        if error < best_error:
+            best_error = error
+            best_result = data
+            best_distance = dist
+        
+        if error <= ratio_tolerance:
+            return (dist, data, error)
+        if error >= prev_error:
+            break  # Diverging - leave it to the bracketing search
+        prev_error = error
+        
+        step = dist * 1e-4
+        if dist + step > dist_max:
+            step = -step
+        probe = evaluate_fn(dist + step)
+        if probe is None:
+            break
+        
+        slope = (probe[0] - ratio) / step
+        if not math.isfinite(slope) or abs(slope) < ZERO_TOLERANCE:
+            break
+        
+        next_dist = min(max(dist - residual / slope, dist_min), dist_max)
+        if next_dist == dist:
+            break
+        dist = next_dist
+    
     # Generate candidate distances (log spacing)
     n_candidates = min(config.min_candidates, config.max_iterations * 2)
     candidates = np.geomspace(dist_min, dist_max, num=n_candidates)
@@ -143,14 +190,10 @@ def find_icr_distance(
         candidates = np.sort(np.unique(np.append(candidates, eccentricity)))
     
     # Phase 1: Coarse search
-    best_result: dict | None = None
-    best_distance = 0.0
-    best_error = float("inf")
-    
-    # Track for bracketing
+    # Track for bracketing: (d_lo, residual_lo, d_hi, residual_hi)
     prev_ratio: float | None = None
     prev_dist: float | None = None
-    bracket: Tuple[float, float] | None = None
+    bracket: Tuple[float, float, float, float] | None = None
     
     for dist in candidates:
         eval_result = evaluate_fn(float(dist))
@@ -163,7 +206,7 @@ def find_icr_distance(
         # Check for bracket (sign change)
         if prev_ratio is not None and prev_dist is not None:
             if (ratio - target_ratio) * (prev_ratio - target_ratio) < 0:
-                bracket = (prev_dist, float(dist))
+                bracket = (prev_dist, prev_ratio - target_ratio, float(dist), ratio - target_ratio)
         
         prev_ratio = ratio
         prev_dist = float(dist)
@@ -178,38 +221,65 @@ def find_icr_distance(
         if error <= ratio_tolerance:
             return (float(dist), data, error)
     
-    # Phase 2: Bisection refinement if bracket found
+    # Phase 2: Brent refinement if bracket found
     if config.refine_bisection and bracket is not None:
-        d_lo, d_hi = bracket
+        a, fa, b, fb = bracket
+        c, fc = a, fa
+        d = e = b - a
         
         for _ in range(config.bisection_iterations):
-            d_mid = (d_lo + d_hi) / 2
-            eval_result = evaluate_fn(d_mid)
+            # Keep the root between b and c, with b the better estimate
+            if (fb > 0) == (fc > 0):
+                c, fc = a, fa
+                d = e = b - a
+            if abs(fc) < abs(fb):
+                a, b, c = b, c, b
+                fa, fb, fc = fb, fc, fb
+            
+            tol = 2.0 * np.finfo(float).eps * abs(b) + 0.5 * POSITION_TOLERANCE
+            m = 0.5 * (c - b)
+            if abs(m) <= tol:
+                break
+            
+            if abs(e) >= tol and abs(fa) > abs(fb):
+                # Secant (a == c) or inverse quadratic interpolation
+                s = fb / fa
+                if a == c:
+                    p = 2.0 * m * s
+                    q = 1.0 - s
+                else:
+                    q = fa / fc
+                    r = fb / fc
+                    p = s * (2.0 * m * q * (q - r) - (b - a) * (r - 1.0))
+                    q = (q - 1.0) * (r - 1.0) * (s - 1.0)
+                if p > 0:
+                    q = -q
+                p = abs(p)
+                if 2.0 * p < min(3.0 * m * q - abs(tol * q), abs(e * q)):
+                    e, d = d, p / q
+                else:
+                    d = e = m
+            else:
+                d = e = m
             
+            a, fa = b, fb
+            b += d if abs(d) > tol else math.copysign(tol, m)
+            
+            eval_result = evaluate_fn(b)
             if eval_result is None:
                 break
             
             ratio, data = eval_result
-            error = abs(ratio - target_ratio)
+            fb = ratio - target_ratio
+            error = abs(fb)
             
             if error < best_error:
                 best_error = error
                 best_result = data
-                best_distance = d_mid
+                best_distance = b
             
             if error <= ratio_tolerance:
-                return (d_mid, data, error)
-            
-            # Update bracket
-            eval_lo = evaluate_fn(d_lo)
-            if eval_lo is not None:
-                ratio_lo = eval_lo[0]
-                if (ratio - target_ratio) * (ratio_lo - target_ratio) < 0:
-                    d_hi = d_mid
-                else:
-                    d_lo = d_mid
-            else:
-                break
+                return (b, data, error)
     
     if best_result is not None:
         return (best_distance, best_result, best_error)
@@ -246,12 +316,16 @@ def compute_torsional_forces(
     # Distance from each element to ICR
     dy_icr = positions_y - icr_y
     dz_icr = positions_z - icr_z
-    c_arr = np.hypot(dy_icr, dz_icr)
-    c_arr = np.where(c_arr < POSITION_TOLERANCE, POSITION_TOLERANCE, c_arr)
+    c2_arr = dy_icr * dy_icr + dz_icr * dz_icr
+    # An element at the ICR is rare; one min reduction decides whether the
+    # elementwise clamp is needed at all.
+    if c2_arr.min() < POSITION_TOLERANCE ** 2:
+        np.maximum(c2_arr, POSITION_TOLERANCE ** 2, out=c2_arr)
+    inv_c = 1.0 / np.sqrt(c2_arr)
     
     # Force direction perpendicular to radius (CCW rotation)
-    dir_y = -dz_icr / c_arr
-    dir_z = dy_icr / c_arr
+    dir_y = -dz_icr * inv_c
+    dir_z = dy_icr * inv_c
     
     # Force components
     Fy_arr = force_magnitudes * dir_y
@@ -306,10 +380,9 @@ def compute_equilibrium_ratio(
     dy_cent = positions_y - centroid_y
     dz_cent = positions_z - centroid_z
     
+    sum_M = float(dy_cent @ Fz_arr - dz_cent @ Fy_arr)
     if flipped:
-        sum_M = float(np.sum(dy_cent * (-Fz_arr) - dz_cent * (-Fy_arr)))
-    else:
-        sum_M = float(np.sum(dy_cent * Fz_arr - dz_cent * Fy_arr))
+        sum_M = -sum_M
     
     ratio = sum_M / P_total
     
@@ -328,26 +401,44 @@ class CrawfordKulakParams:
     delta_max: float = 8.64  # Ultimate deformation (mm)
 
 
+def _crawford_kulak_scalar(
+    delta: float,
+    R_ult: float,
+    mu: float,
+    lambda_exp: float,
+    delta_max: float
+) -> float:
+    """Scalar Crawford-Kulak force using `math` (no NumPy ufunc overhead)."""
+    rho = min(1.0, max(1e-6, delta / delta_max))
+    return R_ult * (-math.expm1(-mu * rho)) ** lambda_exp
+
+
 def crawford_kulak_force(
-    delta: np.ndarray,
+    delta: np.ndarray | float,
     R_ult: float,
     params: CrawfordKulakParams = CrawfordKulakParams()
-) -> np.ndarray:
+) -> np.ndarray | float:
     """
     Crawford-Kulak load-deformation model for bolts.
     
     R = R_ult × (1 - e^(-μΔ/Δ_max))^λ
     
     Args:
-        delta: Deformation at each bolt (mm)
+        delta: Deformation at each bolt (mm); a plain float takes a scalar fast path
         R_ult: Ultimate bolt capacity (kN)
         params: Model parameters
         
     Returns:
-        Force at each bolt (kN)
+        Force at each bolt (kN), as a float for scalar `delta`
     """
-    rho = np.clip(delta / params.delta_max, 1e-6, 1.0)
-    return R_ult * np.power(1.0 - np.exp(-params.mu * rho), params.lambda_exp)
+    if isinstance(delta, (float, int)):
+        return _crawford_kulak_scalar(
+            float(delta), R_ult, params.mu, params.lambda_exp, params.delta_max
+        )
+    
+    rho = np.clip(np.asarray(delta, dtype=float) / params.delta_max, 1e-6, 1.0)
+    # 1 - e^(-x) evaluated as -expm1(-x): accurate for the small rho near the ICR.
+    return R_ult * np.power(-np.expm1(-params.mu * rho), params.lambda_exp)
 
 
 @dataclass
@@ -5,14 +5,16 @@ Defines forces and moments that can be applied to a welded connection.
 """
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Tuple
-import math
+from typing import Sequence, Tuple
+from math import hypot as _hypot
+
+import numpy as np
 
 # Type alias
 Point = Tuple[float, float, float]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Load:
     """
     Applied force and moment at a specific location.
@@ -65,12 +67,12 @@ class Load:
     @property
     def shear_magnitude(self) -> float:
         """Magnitude of in-plane shear force."""
-        return math.sqrt(self.Fy**2 + self.Fz**2)
+        return _hypot(self.Fy, self.Fz)
     
     @property
     def total_force_magnitude(self) -> float:
         """Magnitude of total force vector."""
-        return math.sqrt(self.Fx**2 + self.Fy**2 + self.Fz**2)
+        return _hypot(self.Fx, self.Fy, self.Fz)
     
     def at(self, x: float = 0.0, y: float = 0.0, z: float = 0.0) -> Tuple[float, float, float, float, float, float]:
         """
@@ -87,30 +89,93 @@ class Load:
         Returns:
             Tuple of (Fx, Fy, Fz, Mx_total, My_total, Mz_total)
         """
+        Fx, Fy, Fz = self.Fx, self.Fy, self.Fz
+        
+        # Pure moment: no eccentricity to transfer
+        if Fx == 0.0 and Fy == 0.0 and Fz == 0.0:
+            return (Fx, Fy, Fz, self.Mx, self.My, self.Mz)
+        
         # Distance from point to load location
-        dx = self.x_loc - x
-        dy = self.y_loc - y
-        dz = self.z_loc - z
+        lx, ly, lz = self.location
+        dx = lx - x
+        dy = ly - y
+        dz = lz - z
         
         # Moment from force eccentricity:
         # Mx (torsion): Fz × dy - Fy × dz (in-plane moment)
-        Mx_eccentric = self.Fz * dy - self.Fy * dz
+        Mx_eccentric = Fz * dy - Fy * dz
         
         # My (bending about y): Fz × dx - Fx × dz
-        My_eccentric = self.Fz * dx - self.Fx * dz
+        My_eccentric = Fz * dx - Fx * dz
         
         # Mz (bending about z): Fx × dy - Fy × dx
-        Mz_eccentric = self.Fx * dy - self.Fy * dx
+        Mz_eccentric = Fx * dy - Fy * dx
         
         return (
-            self.Fx,
-            self.Fy,
-            self.Fz,
+            Fx,
+            Fy,
+            Fz,
             self.Mx + Mx_eccentric,
             self.My + My_eccentric,
             self.Mz + Mz_eccentric
         )
     
+    def at_many(self, points: np.ndarray) -> np.ndarray:
+        """
+        Vectorized `at` for many points.
+        
+        Args:
+            points: (N, 3) array of (x, y, z) coordinates
+            
+        Returns:
+            (N, 6) array of (Fx, Fy, Fz, Mx_total, My_total, Mz_total) rows
+        """
+        pts = np.asarray(points, dtype=float).reshape(-1, 3)
+        d = np.asarray(self.location, dtype=float) - pts
+        dx, dy, dz = d[:, 0], d[:, 1], d[:, 2]
+        
+        out = np.empty((pts.shape[0], 6), dtype=float)
+        out[:, 0] = self.Fx
+        out[:, 1] = self.Fy
+        out[:, 2] = self.Fz
+        out[:, 3] = self.Mx + (self.Fz * dy - self.Fy * dz)
+        out[:, 4] = self.My + (self.Fz * dx - self.Fx * dz)
+        out[:, 5] = self.Mz + (self.Fx * dy - self.Fy * dx)
+        return out
+    
+    @classmethod
+    def equivalent_at_many(cls, loads: Sequence[Load], points: np.ndarray) -> np.ndarray:
+        """
+        Equivalent loads for many load cases at many points.
+        
+        Args:
+            loads: K load cases
+            points: (N, 3) array of (x, y, z) coordinates
+            
+        Returns:
+            (K, N, 6) array; entry [k, i] equals loads[k].at(*points[i])
+        """
+        data = np.array(
+            [(ld.Fx, ld.Fy, ld.Fz, ld.Mx, ld.My, ld.Mz, *ld.location) for ld in loads],
+            dtype=float,
+        ).reshape(-1, 9)
+        pts = np.asarray(points, dtype=float).reshape(-1, 3)
+        
+        # Broadcast (K, 1) load columns against (1, N) point columns
+        Fx, Fy, Fz, Mx, My, Mz, lx, ly, lz = (col[:, None] for col in data.T)
+        dx = lx - pts[:, 0]
+        dy = ly - pts[:, 1]
+        dz = lz - pts[:, 2]
+        
+        out = np.empty((data.shape[0], pts.shape[0], 6), dtype=float)
+        out[..., 0] = Fx
+        out[..., 1] = Fy
+        out[..., 2] = Fz
+        out[..., 3] = Mx + (Fz * dy - Fy * dz)
+        out[..., 4] = My + (Fz * dx - Fx * dz)
+        out[..., 5] = Mz + (Fx * dy - Fy * dx)
+        return out
+    
     def get_moments_about(self, x: float = 0.0, y: float = 0.0, z: float = 0.0) -> Tuple[float, float, float]:
         """
         Calculate total moments about a point (x, y, z).
@@ -135,16 +200,13 @@ class Load:
         M_new = M_old + r x F, where r is the offset from the new point to the
         original load application point.
         """
-        Fx, Fy, Fz, Mx, My, Mz = self.at(x=location[0], y=location[1], z=location[2])
-        return Load(
-            Fx=float(Fx),
-            Fy=float(Fy),
-            Fz=float(Fz),
-            Mx=float(Mx),
-            My=float(My),
-            Mz=float(Mz),
-            location=tuple(location),
-        )
+        components = self.at(x=location[0], y=location[1], z=location[2])
+        # Loads built from float inputs already yield floats; only cast the rest.
+        if not all(type(v) is float for v in components):
+            components = tuple(map(float, components))
+        if not isinstance(location, tuple):
+            location = tuple(location)
+        return Load(*components, location=location)
     
     @classmethod
     def from_components(
@@ -95,6 +95,7 @@ class Weld:
     # Cached properties
     _properties: WeldProperties | None = field(default=None, repr=False, init=False)
     _discretized_points: List[Tuple[Point, float, Point, object]] | None = field(default=None, repr=False, init=False)
+    _discretized_arrays: Tuple[list, Tuple[np.ndarray, ...]] | None = field(default=None, repr=False, init=False)
     
     def __post_init__(self) -> None:
         # Validate geometry
@@ -197,6 +198,33 @@ class Weld:
         self._discretized_points = points_with_ds
         return points_with_ds
     
+    def _discretize_arrays(
+        self, discretization: int = 200
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Discretized weld points as parallel read-only arrays.
+        
+        Built once from `_discretize` and reused for as long as that cache holds.
+        
+        Returns:
+            (y, z, ds, t_y, t_z) arrays, one entry per discretized point.
+        """
+        points_ds = self._discretize(discretization)
+        cached = self._discretized_arrays
+        if cached is not None and cached[0] is points_ds:
+            return cached[1]
+        
+        data = np.array(
+            [(p[0][0], p[0][1], p[1], p[2][0], p[2][1]) for p in points_ds],
+            dtype=float,
+        ).reshape(-1, 5)
+        columns = tuple(np.ascontiguousarray(data[:, i]) for i in range(5))
+        for arr in columns:
+            arr.flags.writeable = False
+        
+        self._discretized_arrays = (points_ds, columns)
+        return columns
+    
     def _calculate_properties(self, discretization: int = 200) -> WeldProperties:
         """Calculate weld group geometric properties."""
         if self._properties is not None:
@@ -217,9 +245,7 @@ class Weld:
                 raise ValueError("Throat thickness not defined")
         
         # Calculate centroid
-        y_arr = np.array([p[0][0] for p in points_ds])
-        z_arr = np.array([p[0][1] for p in points_ds])
-        ds_arr = np.array([p[1] for p in points_ds])
+        y_arr, z_arr, ds_arr, _, _ = self._discretize_arrays(discretization)
         
         if self.parameters.type in ("plug", "slot"):
             # For plug/slot, use provided area
@@ -1,7 +1,7 @@
 """
 Plotting functions for weld stress visualization.
 
-Provides plotting methods called by StressResult.plot().
+Provides plotting methods called by the LoadedWeld plot methods.
 """
 from __future__ import annotations
 from typing import List, TYPE_CHECKING, Any, Sequence
@@ -9,7 +9,6 @@ import math
 import numpy as np
 
 if TYPE_CHECKING:
-    from .weld_stress import LoadedWeldResult
     from .loaded_weld import LoadedWeld
     from .weld import Weld
 
@@ -35,6 +34,7 @@ def plot_loaded_weld(
     """
     Plot stress distribution for a LoadedWeld.
     """
+    owns_figure = ax is None
     if ax is None:
         fig, ax = plt.subplots(figsize=(10, 8))
     else:
@@ -53,7 +53,9 @@ def plot_loaded_weld(
         legend=legend
     )
     
-    plt.tight_layout()
+    # A caller-supplied axes belongs to a layout the caller manages.
+    if owns_figure and (save_path or show):
+        plt.tight_layout()
     
     if save_path:
         if not save_path.endswith('.svg'):
@@ -85,6 +87,7 @@ def plot_loaded_weld_utilization(
     """
     Plot weld path colored by weld-metal utilisation (AISC weld metal basis).
     """
+    owns_figure = ax is None
     if ax is None:
         fig, ax = plt.subplots(figsize=(10, 8))
     else:
@@ -120,7 +123,9 @@ def plot_loaded_weld_utilization(
         title += f"\nMax Util: {max(utils):.2f}"
     ax.set_title(title, fontsize=12)
 
-    plt.tight_layout()
+    # A caller-supplied axes belongs to a layout the caller manages.
+    if owns_figure and (save_path or show):
+        plt.tight_layout()
 
     if save_path:
         if not save_path.endswith(".svg"):
@@ -155,6 +160,7 @@ def plot_loaded_weld_directional_factor(
     - k_ds is computed from the local in-plane stress resultant direction and local weld tangent.
     - If `conservative_k_ds` is True (or analysis has include_kds=False), k_ds is 1.0 everywhere.
     """
+    owns_figure = ax is None
     if ax is None:
         fig, ax = plt.subplots(figsize=(10, 8))
     else:
@@ -188,7 +194,9 @@ def plot_loaded_weld_directional_factor(
         title += f"\nMin/Max: {min(kds_values):.2f} / {max(kds_values):.2f}"
     ax.set_title(title, fontsize=12)
 
-    plt.tight_layout()
+    # A caller-supplied axes belongs to a layout the caller manages.
+    if owns_figure and (save_path or show):
+        plt.tight_layout()
 
     if save_path:
         if not save_path.endswith(".svg"):
@@ -353,6 +361,20 @@ def _plot_single_loaded_weld(
     ax.set_title(title, fontsize=12)
 
 
+def _fit_limits_to_points(ax: plt.Axes, point_stresses: list) -> None:
+    """Fit axis limits (z horizontal, y vertical) to weld points with a 20% margin."""
+    if not point_stresses:
+        return
+
+    n = len(point_stresses)
+    yz = np.fromiter((v for ps in point_stresses for v in (ps.y, ps.z)), dtype=float, count=2 * n).reshape(n, 2)
+    lo = yz.min(axis=0)
+    hi = yz.max(axis=0)
+    margin = float((hi - lo).max()) * 0.2
+    ax.set_xlim(lo[1] - margin, hi[1] + margin)
+    ax.set_ylim(lo[0] - margin, hi[0] + margin)
+
+
 def _plot_loaded_weld_stress(
     ax: plt.Axes,
     loaded: LoadedWeld,
@@ -402,23 +424,15 @@ def _plot_loaded_weld_stress(
             points = np.array([[p[1], p[0]] for p in seg_points])  # (z, y) for plotting
             segments = np.array([points[:-1], points[1:]]).transpose(1, 0, 2)
             
-            # Color by average stress of each segment
-            colors = []
-            for i in range(len(seg_stresses) - 1):
-                avg_stress = (seg_stresses[i] + seg_stresses[i + 1]) / 2
-                colors.append(colormap(norm(avg_stress)))
+            # Color by average stress of each segment (one colormap pass)
+            stress_arr = np.asarray(seg_stresses, dtype=float)
+            colors = colormap(norm(0.5 * (stress_arr[:-1] + stress_arr[1:])))
             
             lc = LineCollection(segments, colors=colors, linewidths=linewidth)
             ax.add_collection(lc)
     
     # Update axis limits
-    all_y = [ps.y for ps in loaded.point_stresses]
-    all_z = [ps.z for ps in loaded.point_stresses]
-    
-    if all_y and all_z:
-        margin = max(max(all_y) - min(all_y), max(all_z) - min(all_z)) * 0.2
-        ax.set_xlim(min(all_z) - margin, max(all_z) + margin)
-        ax.set_ylim(min(all_y) - margin, max(all_y) + margin)
+    _fit_limits_to_points(ax, loaded.point_stresses)
 
 
 def _plot_loaded_weld_scalar_field(
@@ -469,240 +483,13 @@ def _plot_loaded_weld_scalar_field(
             points = np.array([[p[1], p[0]] for p in seg_points])  # (z, y) for plotting
             segments = np.array([points[:-1], points[1:]]).transpose(1, 0, 2)
 
-            colors: list[tuple[float, float, float, float]] = []
-            for i in range(len(seg_values) - 1):
-                avg_value = (seg_values[i] + seg_values[i + 1]) / 2.0
-                colors.append(colormap(norm(avg_value)))
+            value_arr = np.asarray(seg_values, dtype=float)
+            colors = colormap(norm(0.5 * (value_arr[:-1] + value_arr[1:])))
 
             lc = LineCollection(segments, colors=colors, linewidths=linewidth)
             ax.add_collection(lc)
 
-    all_y = [ps.y for ps in loaded.point_stresses]
-    all_z = [ps.z for ps in loaded.point_stresses]
-
-    if all_y and all_z:
-        margin = max(max(all_y) - min(all_y), max(all_z) - min(all_z)) * 0.2
-        ax.set_xlim(min(all_z) - margin, max(all_z) + margin)
-        ax.set_ylim(min(all_y) - margin, max(all_y) + margin)
-
-
-import matplotlib.pyplot as plt
-import matplotlib.colors as mcolors
-from matplotlib.collections import LineCollection
-from matplotlib.lines import Line2D
-
-
-def plot_stress_result(
-    result: LoadedWeldResult,
-    section: bool = True,
-    force: bool = True,
-    colorbar: bool = True,
-    cmap: str = "coolwarm",
-    weld_linewidth: float = 5.0,
-    ax: plt.Axes | None = None,
-    show: bool = True,
-    save_path: str | None = None,
-    info: bool = True,
-    legend: bool = False,
-) -> plt.Axes:
-    """
-    Plot stress distribution along the weld.
-    """
-    if ax is None:
-        fig, ax = plt.subplots(figsize=(10, 8))
-    else:
-        fig = ax.figure
-    
-    # Delegate to internal plotter
-    _plot_single_weld_result(
-        ax, 
-        result, 
-        section=section, 
-        force=force, 
-        colorbar=colorbar,
-        cmap=cmap, 
-        weld_linewidth=weld_linewidth,
-        info=info,
-        legend=legend
-    )
-    
-    plt.tight_layout()
-    
-    if save_path:
-        if not save_path.endswith('.svg'):
-            save_path += '.svg'
-        fig.savefig(save_path, format='svg', bbox_inches='tight')
-        print(f"Saved: {save_path}")
-    
-    if show:
-        plt.show()
-    
-    return ax
-
-
-def plot_stress_comparison(
-    results: Sequence[LoadedWeldResult],
-    section: bool = True,
-    force: bool = True,
-    colorbar: bool = True,
-    cmap: str = "coolwarm",
-    weld_linewidth: float = 5.0,
-    show: bool = True,
-    save_path: str | None = None,
-    info: bool = True,
-    legend: bool = False,
-) -> plt.Figure:
-    """
-    Plot multiple stress results with a shared colorbar.
-    
-    Layout toggles between vertical stacks for wide welds and horizontal stacks
-    for tall welds to keep the view balanced. The colorbar remains shared on the
-    right-hand side regardless of stacking.
-    
-    Args:
-        results: List of StressResult objects to compare
-        section, force, colorbar, cmap, weld_linewidth, show, save_path, info, legend:
-            Same as plot_stress_result
-            
-    Returns:
-        Matplotlib Figure
-    """
-    n = len(results)
-    if n == 0:
-        raise ValueError("No results to plot")
-
-    y_coords: list[float] = []
-    z_coords: list[float] = []
-    for result in results:
-        if not result.point_stresses:
-            continue
-        y_coords.extend(ps.y for ps in result.point_stresses)
-        z_coords.extend(ps.z for ps in result.point_stresses)
-
-    y_range = max(y_coords) - min(y_coords) if y_coords else 0.0
-    z_range = max(z_coords) - min(z_coords) if z_coords else 0.0
-
-    stack_vertically = z_range >= y_range
-
-    if stack_vertically:
-        fig, axes = plt.subplots(n, 1, figsize=(10, 5 * n))
-        fig.subplots_adjust(hspace=0.2)
-    else:
-        fig, axes = plt.subplots(1, n, figsize=(6 * n, 10))
-        fig.subplots_adjust(wspace=0.2)
-
-    if isinstance(axes, np.ndarray):
-        axes_list = list(axes.flatten())
-    else:
-        axes_list = [axes]
-        
-    # Calculate global min/max for shared color scale
-    global_min = min(r.min for r in results)
-    global_max = max(r.max for r in results)
-    
-    # Plot each result
-    for i, (result, ax) in enumerate(zip(results, axes_list)):
-        _plot_single_weld_result(
-            ax,
-            result,
-            section=section,
-            force=force,
-            colorbar=False, # We'll add a shared one
-            cmap=cmap,
-            weld_linewidth=weld_linewidth,
-            info=info,
-            legend=legend,
-            vmin=global_min,
-            vmax=global_max
-        )
-        
-    # Add shared colorbar
-    if colorbar:
-        # Create a new axes for the colorbar on the right side
-        fig.subplots_adjust(right=0.85)
-        cbar_ax = fig.add_axes([0.90, 0.15, 0.02, 0.7])
-        
-        norm = mcolors.Normalize(vmin=global_min, vmax=global_max)
-        sm = plt.cm.ScalarMappable(cmap=cmap, norm=norm)
-        sm.set_array([])
-        
-        cbar = fig.colorbar(sm, cax=cbar_ax)
-        cbar.set_label('Stress (MPa)', fontsize=12)
-        
-    if save_path:
-        if not save_path.endswith('.svg'):
-            save_path += '.svg'
-        fig.savefig(save_path, format='svg', bbox_inches='tight')
-        print(f"Saved: {save_path}")
-        
-    if show:
-        plt.show()
-        
-    return fig
-
-
-def _plot_single_weld_result(
-    ax: plt.Axes,
-    result: LoadedWeldResult,
-    section: bool = True,
-    force: bool = True,
-    colorbar: bool = True,
-    cmap: str = "coolwarm",
-    weld_linewidth: float = 5.0,
-    info: bool = True,
-    legend: bool = False,
-    vmin: float | None = None,
-    vmax: float | None = None
-) -> None:
-    """Internal helper to plot a single result onto an axes."""
-    weld = result.loaded_weld.weld
-    
-    # Plot section outline if available and requested
-    if section and weld.section is not None:
-        _plot_section_outline(ax, weld.section)
-    
-    # Collect weld segments for colored line plotting
-    _plot_weld_stress(ax, result, cmap, weld_linewidth, vmin, vmax)
-    
-    # Add colorbar if requested (for single plots)
-    if colorbar and result.point_stresses:
-        stress_min = vmin if vmin is not None else result.min
-        stress_max = vmax if vmax is not None else result.max
-        
-        norm = mcolors.Normalize(vmin=stress_min, vmax=stress_max)
-        sm = plt.cm.ScalarMappable(cmap=cmap, norm=norm)
-        sm.set_array([])
-        
-        cbar = ax.figure.colorbar(sm, ax=ax, shrink=0.8, aspect=30)
-        cbar.set_label('Stress (MPa)', fontsize=10)
-    
-    # Plot force arrow and centroid
-    if force:
-        _plot_force_arrow(ax, result.loaded_weld.load, weld, legend=legend)
-    
-    # Plot ICR point if available
-    if result.icr_point is not None:
-        icr_y, icr_z = result.icr_point[0], result.icr_point[1]
-        ax.plot(icr_z, icr_y, 'ko', markersize=8)
-        
-        # Always label ICR point with annotation
-        ax.annotate('ICR', 
-                    xy=(icr_z, icr_y), 
-                    xytext=(10, 10), 
-                    textcoords='offset points',
-                    fontsize=9,
-                    bbox=dict(boxstyle='round,pad=0.3', facecolor='white', alpha=0.8, edgecolor='black'))
-    
-    # Formatting
-    ax.set_aspect('equal')
-    ax.set_xlabel('z', fontsize=11)
-    ax.set_ylabel('y', fontsize=11)
-    
-    # Title with key info
-    title = f"Weld Stress ({result.method.upper()} method)"
-    if info and result.point_stresses:
-        title += f"\nMax Stress: {result.max:.1f} MPa"
-    ax.set_title(title, fontsize=12)
+    _fit_limits_to_points(ax, loaded.point_stresses)
 
 
 def plot_weld_geometry(
@@ -772,74 +559,6 @@ def _plot_section_outline(ax: plt.Axes, section) -> None:
             ax.plot(z_coords, y_coords, color=edge_color, linewidth=1.0, linestyle='-')
 
 
-def _plot_weld_stress(
-    ax: plt.Axes,
-    result: LoadedWeldResult,
-    cmap: str,
-    linewidth: float,
-    vmin: float | None = None,
-    vmax: float | None = None
-) -> None:
-    """Plot weld path colored by stress."""
-    if not result.point_stresses:
-        return
-    
-    weld = result.loaded_weld.weld
-    stress_min = vmin if vmin is not None else result.min
-    stress_max = vmax if vmax is not None else result.max
-    
-    # Normalize stresses
-    if stress_max - stress_min > 1e-12:
-        norm = mcolors.Normalize(vmin=stress_min, vmax=stress_max)
-    else:
-        norm = mcolors.Normalize(vmin=0, vmax=max(stress_max, 1))
-    
-    colormap = plt.get_cmap(cmap)
-    
-    # Group points by contour/segment for proper line plotting
-    for contour in weld.geometry.contours:
-        for segment in contour.segments:
-            seg_points = segment.discretize(resolution=100)
-            
-            if len(seg_points) < 2:
-                continue
-            
-            # Find stresses for points on this segment
-            seg_stresses = []
-            for sp in seg_points:
-                # Find nearest point stress
-                min_dist = float('inf')
-                nearest_stress = 0.0
-                for ps in result.point_stresses:
-                    dist = math.hypot(ps.y - sp[0], ps.z - sp[1])
-                    if dist < min_dist:
-                        min_dist = dist
-                        nearest_stress = ps.stress
-                seg_stresses.append(nearest_stress)
-            
-            # Create line segments
-            points = np.array([[p[1], p[0]] for p in seg_points])  # (z, y) for plotting
-            segments = np.array([points[:-1], points[1:]]).transpose(1, 0, 2)
-            
-            # Color by average stress of each segment
-            colors = []
-            for i in range(len(seg_stresses) - 1):
-                avg_stress = (seg_stresses[i] + seg_stresses[i + 1]) / 2
-                colors.append(colormap(norm(avg_stress)))
-            
-            lc = LineCollection(segments, colors=colors, linewidths=linewidth)
-            ax.add_collection(lc)
-    
-    # Update axis limits
-    all_y = [ps.y for ps in result.point_stresses]
-    all_z = [ps.z for ps in result.point_stresses]
-    
-    if all_y and all_z:
-        margin = max(max(all_y) - min(all_y), max(all_z) - min(all_z)) * 0.2
-        ax.set_xlim(min(all_z) - margin, max(all_z) + margin)
-        ax.set_ylim(min(all_y) - margin, max(all_y) + margin)
-
-
 def _plot_force_arrow(ax: plt.Axes, force, weld, legend: bool = False) -> None:
     """
     Plot force application point and weld centroid with text labels on plot.
@@ -923,7 +642,7 @@ def _plot_force_arrow(ax: plt.Axes, force, weld, legend: bool = False) -> None:
 
 
 def plot_stress_components(
-    result: LoadedWeldResult,
+    loaded: LoadedWeld,
     components: List[str],
     layout: str = "grid",
     **kwargs: Any
@@ -932,7 +651,7 @@ def plot_stress_components(
     Plot individual stress components.
     
     Args:
-        result: StressResult from calculation
+        loaded: LoadedWeld with calculated point stresses
         components: Which components to plot
         layout: "grid" or "row"
         **kwargs: Passed to individual plots
@@ -971,9 +690,9 @@ def plot_stress_components(
         ax = axes[i]
         
         # Simple scatter plot for components
-        y_coords = [ps.y for ps in result.point_stresses]
-        z_coords = [ps.z for ps in result.point_stresses]
-        stresses = [stress_fn(ps.components) for ps in result.point_stresses]
+        y_coords = [ps.y for ps in loaded.point_stresses]
+        z_coords = [ps.z for ps in loaded.point_stresses]
+        stresses = [stress_fn(ps.components) for ps in loaded.point_stresses]
         
         sc = ax.scatter(z_coords, y_coords, c=stresses, cmap='coolwarm', s=10)
         fig.colorbar(sc, ax=ax, shrink=0.8)
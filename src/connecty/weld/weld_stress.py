@@ -13,7 +13,8 @@ ICR Method (AISC preferred for fillet welds):
 """
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import List, Tuple, TYPE_CHECKING
+from functools import partial
+from typing import List, NamedTuple, Tuple, TYPE_CHECKING
 import math
 import numpy as np
 
@@ -79,16 +80,12 @@ class StressComponents:
     @property
     def shear_resultant(self) -> float:
         """Resultant in-plane shear stress."""
-        return math.sqrt(self.total_y**2 + self.total_z**2)
+        return math.hypot(self.total_y, self.total_z)
     
     @property
     def resultant(self) -> float:
         """Total resultant stress magnitude."""
-        return math.sqrt(
-            self.total_axial**2 +
-            self.total_y**2 +
-            self.total_z**2
-        )
+        return math.hypot(self.total_axial, self.total_y, self.total_z)
 
 
 @dataclass
@@ -204,11 +201,123 @@ def calculate_elastic_stress(
     loaded_weld.point_stresses = point_stresses
 
 
+class _ICREvalContext(NamedTuple):
+    """Constants of one weld ICR solve, passed explicitly to the evaluator."""
+    y_arr: np.ndarray
+    z_arr: np.ndarray
+    ds_arr: np.ndarray
+    tan_y_arr: np.ndarray
+    tan_z_arr: np.ndarray
+    dy_cent: np.ndarray
+    dz_cent: np.ndarray
+    Cy: float
+    Cz: float
+    perp_y: float
+    perp_z: float
+    moment_sign: float
+    Fy_app: float
+    Fz_app: float
+    leg: float
+    throat: float
+    F_EXX: float
+    include_kds: bool
+
+
+# Per-element fields, cast together for a reduced-precision search
+_ICR_ARRAY_FIELDS = _ICREvalContext._fields[:7]
+
+
+def _evaluate_icr_distance(
+    ctx: _ICREvalContext,
+    distance: float,
+) -> Tuple[float, dict[str, np.ndarray]] | None:
+    """Evaluate ICR response for a distance from centroid."""
+    # Unpack once so the body works on plain locals
+    (y_arr, z_arr, ds_arr, tan_y_arr, tan_z_arr, dy_cent, dz_cent,
+     Cy, Cz, perp_y, perp_z, moment_sign, Fy_app, Fz_app,
+     leg, throat, F_EXX, include_kds) = ctx
+    icr_offset = moment_sign * distance
+    icr_y = Cy + perp_y * icr_offset
+    icr_z = Cz + perp_z * icr_offset
+    
+    dy_icr = y_arr - icr_y
+    dz_icr = z_arr - icr_z
+    # One sqrt and one reciprocal; the direction cosines and the
+    # deformation limit below multiply by inv_c instead of dividing.
+    # The clamp only runs when an element actually sits on the ICR.
+    c_arr = dy_icr * dy_icr + dz_icr * dz_icr
+    if c_arr.min() < POSITION_TOLERANCE ** 2:
+        np.maximum(c_arr, POSITION_TOLERANCE ** 2, out=c_arr)
+    np.sqrt(c_arr, out=c_arr)
+    inv_c = 1.0 / c_arr
+    
+    dir_y = -dz_icr * inv_c
+    dir_z = dy_icr * inv_c
+    
+    # Calculate angle between force direction and weld tangent
+    cos_theta = np.clip(np.abs(dir_y * tan_y_arr + dir_z * tan_z_arr), 0.0, 1.0)
+    theta = np.degrees(np.arccos(cos_theta))
+    
+    # Use shared deformation limit functions
+    delta_u, delta_m = aisc_weld_deformation_limits(theta, leg)
+    
+    lambda_limit = float(np.min(delta_u * inv_c))
+    if not math.isfinite(lambda_limit) or lambda_limit <= POSITION_TOLERANCE:
+        return None
+    
+    delta = np.minimum(lambda_limit * c_arr, delta_u)
+    
+    # Use shared stress calculation
+    F_w = aisc_weld_stress(
+        delta,
+        delta_m,
+        delta_u,
+        theta,
+        F_EXX,
+        include_kds=include_kds,
+    )
+    R_mag = F_w * throat * ds_arr
+    
+    # Reduce straight from magnitudes and directions; the per-element
+    # force components are never needed, only their sums.
+    sum_Fy = float(R_mag @ dir_y)
+    sum_Fz = float(R_mag @ dir_z)
+    sum_M = float(R_mag @ (dy_cent * dir_z - dz_cent * dir_y))
+    
+    dot = Fy_app * sum_Fy + Fz_app * sum_Fz
+    if dot < 0:
+        dir_y = -dir_y
+        dir_z = -dir_z
+        sum_Fy = -sum_Fy
+        sum_Fz = -sum_Fz
+        sum_M = -sum_M
+    
+    P_base = math.hypot(sum_Fy, sum_Fz)
+    if P_base < POSITION_TOLERANCE or not math.isfinite(P_base):
+        return None
+    
+    ratio = sum_M / P_base
+    
+    return ratio, {
+        "icr_y": icr_y,
+        "icr_z": icr_z,
+        "icr_dist": icr_offset,
+        "F_w": F_w,
+        "dir_y": dir_y,
+        "dir_z": dir_z,
+        "sum_Fy": sum_Fy,
+        "sum_Fz": sum_Fz,
+        "sum_M": sum_M,
+        "P_base": P_base
+    }
+
+
 def calculate_icr_stress(
     loaded_weld: "LoadedWeld",
     discretization: int = 200,
     max_iterations: int = 100,
-    tolerance: float = 1e-6
+    tolerance: float = 1e-6,
+    search_dtype: type = np.float64
 ) -> None:
     """
     Calculate weld stress using the Instantaneous Center of Rotation (ICR) method.
@@ -229,6 +338,8 @@ def calculate_icr_stress(
         discretization: Points per segment
         max_iterations: Maximum solver iterations
         tolerance: Convergence tolerance
+        search_dtype: Float dtype for the ICR search (np.float32 trades ratio
+            precision for bandwidth); the final stresses are always float64
     """
     weld = loaded_weld.weld
     load = loaded_weld.load
@@ -285,11 +396,7 @@ def calculate_icr_stress(
         return
     
     # Prepare discretized weld data
-    y_arr = np.array([p[0][0] for p in points_ds], dtype=float)
-    z_arr = np.array([p[0][1] for p in points_ds], dtype=float)
-    ds_arr = np.array([p[1] for p in points_ds], dtype=float)
-    tan_y_arr = np.array([p[2][0] for p in points_ds], dtype=float)
-    tan_z_arr = np.array([p[2][1] for p in points_ds], dtype=float)
+    y_arr, z_arr, ds_arr, tan_y_arr, tan_z_arr = weld._discretize_arrays(discretization)
     
     if len(y_arr) == 0:
         raise ValueError("ICR method requires discretized weld points")
@@ -311,78 +418,17 @@ def calculate_icr_stress(
         characteristic_size=leg
     )
     
-    def evaluate_distance(distance: float) -> Tuple[float, dict[str, np.ndarray]] | None:
-        """Evaluate ICR response for a distance from centroid."""
-        icr_offset = moment_sign * distance
-        icr_y = Cy + perp_y * icr_offset
-        icr_z = Cz + perp_z * icr_offset
-        
-        dy_icr = y_arr - icr_y
-        dz_icr = z_arr - icr_z
-        c_arr = np.hypot(dy_icr, dz_icr)
-        c_arr = np.where(c_arr < POSITION_TOLERANCE, POSITION_TOLERANCE, c_arr)
-        
-        dir_y = -dz_icr / c_arr
-        dir_z = dy_icr / c_arr
-        
-        # Calculate angle between force direction and weld tangent
-        cos_theta = np.clip(np.abs(dir_y * tan_y_arr + dir_z * tan_z_arr), 0.0, 1.0)
-        theta = np.degrees(np.arccos(cos_theta))
-        
-        # Use shared deformation limit functions
-        delta_u, delta_m = aisc_weld_deformation_limits(theta, leg)
-        
-        lambda_limit = float(np.min(delta_u / c_arr))
-        if not math.isfinite(lambda_limit) or lambda_limit <= POSITION_TOLERANCE:
-            return None
-        
-        delta = np.minimum(lambda_limit * c_arr, delta_u)
-        
-        # Use shared stress calculation
-        F_w = aisc_weld_stress(
-            delta,
-            delta_m,
-            delta_u,
-            theta,
-            F_EXX,
-            include_kds=bool(loaded_weld.include_kds),
+    full_ctx = _ICREvalContext(
+        y_arr, z_arr, ds_arr, tan_y_arr, tan_z_arr, dy_cent, dz_cent,
+        Cy, Cz, perp_y, perp_z, moment_sign, Fy_app, Fz_app,
+        leg, throat, F_EXX, bool(loaded_weld.include_kds),
+    )
+    if np.dtype(search_dtype) == np.float64:
+        search_ctx = full_ctx
+    else:
+        search_ctx = full_ctx._replace(
+            **{name: getattr(full_ctx, name).astype(search_dtype) for name in _ICR_ARRAY_FIELDS}
         )
-        R_mag = F_w * throat * ds_arr
-        
-        R_y = R_mag * dir_y
-        R_z = R_mag * dir_z
-        
-        sum_Fy = float(np.sum(R_y))
-        sum_Fz = float(np.sum(R_z))
-        
-        dot = Fy_app * sum_Fy + Fz_app * sum_Fz
-        if dot < 0:
-            R_y = -R_y
-            R_z = -R_z
-            dir_y = -dir_y
-            dir_z = -dir_z
-            sum_Fy = -sum_Fy
-            sum_Fz = -sum_Fz
-        
-        P_base = math.hypot(sum_Fy, sum_Fz)
-        if P_base < POSITION_TOLERANCE or not math.isfinite(P_base):
-            return None
-        
-        sum_M = float(np.sum(dy_cent * R_z - dz_cent * R_y))
-        ratio = sum_M / P_base
-        
-        return ratio, {
-            "icr_y": icr_y,
-            "icr_z": icr_z,
-            "icr_dist": icr_offset,
-            "F_w": F_w,
-            "dir_y": dir_y,
-            "dir_z": dir_z,
-            "sum_Fy": sum_Fy,
-            "sum_Fz": sum_Fz,
-            "sum_M": sum_M,
-            "P_base": P_base
-        }
     
     # Use shared ICR search
     config = ICRSearchConfig(
@@ -392,7 +438,7 @@ def calculate_icr_stress(
     )
     
     result = find_icr_distance(
-        evaluate_distance,
+        partial(_evaluate_icr_distance, search_ctx),
         target_ratio,
         dist_min,
         dist_max,
@@ -405,7 +451,15 @@ def calculate_icr_stress(
         calculate_elastic_stress(loaded_weld, discretization)
         return
     
-    _, best_result, _ = result
+    best_distance, best_result, _ = result
+    
+    if search_ctx is not full_ctx:
+        # Reduced-precision search: rebuild the final state in float64
+        final = _evaluate_icr_distance(full_ctx, best_distance)
+        if final is None:
+            calculate_elastic_stress(loaded_weld, discretization)
+            return
+        best_result = final[1]
     
     P_base = float(best_result["P_base"])
     if P_base < POSITION_TOLERANCE:
@@ -104,3 +104,203 @@ def test_bolt_result_bolt_forces_dict_matches_bolt_indexing():
     assert forces["Fx"] == [bf.Fx for bf in bf_list]
     assert forces["Fy"] == [bf.Fy for bf in bf_list]
     assert forces["Fz"] == [bf.Fz for bf in bf_list]
+
+
+def test_bolt_forces_soa_matches_bolt_forces():
+    layout = BoltLayout.from_pattern(rows=2, cols=3, spacing_y=100.0, spacing_z=50.0)
+    bolt = BoltParams(diameter=20.0, grade="A325")
+    plate = Plate(corner_a=(-60.0, -60.0), corner_b=(60.0, 60.0), thickness=10.0, fu=450.0, fy=350.0)
+    conn = BoltConnection(layout=layout, bolt=bolt, plate=plate, n_shear_planes=1)
+
+    f = Load(Fx=2000.0, Fy=10000.0, Fz=5000.0, Mx=1.0e5, location=(0.0, 0.0, 0.0))
+    r = conn.analyze(f, shear_method="elastic", tension_method="conservative")
+
+    soa = r.to_bolt_forces_soa()
+    bf_list = r.to_bolt_forces()
+    assert list(soa["y"]) == [p[0] for p in layout.points]
+    assert list(soa["z"]) == [p[1] for p in layout.points]
+    for key in ("Fx", "Fy", "Fz"):
+        assert list(soa[key]) == r.bolt_forces[key]
+    assert list(soa["shear"]) == pytest.approx([bf.shear for bf in bf_list])
+
+
+def test_bolt_force_array_matches_bolt_forces():
+    layout = BoltLayout.from_pattern(rows=2, cols=3, spacing_y=100.0, spacing_z=50.0)
+    bolt = BoltParams(diameter=20.0, grade="A325")
+    plate = Plate(corner_a=(-60.0, -60.0), corner_b=(60.0, 60.0), thickness=10.0, fu=450.0, fy=350.0)
+    conn = BoltConnection(layout=layout, bolt=bolt, plate=plate, n_shear_planes=2)
+
+    f = Load(Fx=2000.0, Fy=10000.0, Fz=5000.0, Mx=1.0e5, location=(0.0, 0.0, 0.0))
+    r = conn.analyze(f, shear_method="elastic", tension_method="conservative")
+
+    arr = r.to_bolt_force_array()
+    bf_list = r.to_bolt_forces()
+    assert len(arr) == layout.n
+    assert [arr[i] for i in range(len(arr))] == bf_list
+    assert list(arr.shear) == pytest.approx([bf.shear for bf in bf_list])
+    assert list(arr.shear_stress) == pytest.approx([bf.shear_stress for bf in bf_list])
+    assert list(arr.tension_stress) == pytest.approx([bf.tension_stress for bf in bf_list])
+
+
+def test_elastic_shear_batch_matches_per_load_analysis():
+    layout = BoltLayout.from_pattern(rows=3, cols=2, spacing_y=75.0, spacing_z=60.0)
+    bolt = BoltParams(diameter=20.0, grade="A325")
+    plate = Plate(corner_a=(-120.0, -60.0), corner_b=(120.0, 60.0), thickness=10.0, fu=450.0, fy=350.0)
+    conn = BoltConnection(layout=layout, bolt=bolt, plate=plate, n_shear_planes=1)
+
+    loads = [
+        Load(Fy=-50_000.0, location=(0.0, 0.0, 150.0)),
+        Load(Fz=20_000.0, Mx=3.0e6, location=(0.0, 40.0, 0.0)),
+        Load(Fy=10_000.0, Fz=-5_000.0, location=(0.0, -30.0, 25.0)),
+    ]
+
+    fys, fzs = conn.elastic_shear_batch(loads)
+    assert fys.shape == fzs.shape == (len(loads), layout.n)
+
+    for i, load in enumerate(loads):
+        forces = conn.analyze(load, shear_method="elastic").to_bolt_force_array()
+        assert fys[i] == pytest.approx(forces.Fy)
+        assert fzs[i] == pytest.approx(forces.Fz)
+
+
+def test_icr_warm_start_matches_cold_solve():
+    import numpy as np
+
+    from connecty.bolt.solvers.icr import solve_bolt_icr
+
+    coords = np.array([(y, z) for y in (0.0, 80.0) for z in (0.0, 75.0, 150.0)])
+    _, _, icr = solve_bolt_icr(coords, Fx=5_000.0, Fy=-40_000.0, Mz=0.0, x_loc=300.0, y_loc=75.0)
+
+    cold = solve_bolt_icr(coords, Fx=5_500.0, Fy=-41_000.0, Mz=0.0, x_loc=300.0, y_loc=75.0)
+    warm = solve_bolt_icr(coords, Fx=5_500.0, Fy=-41_000.0, Mz=0.0, x_loc=300.0, y_loc=75.0, icr_guess=icr)
+    assert warm[0] == pytest.approx(cold[0], rel=1e-3, abs=1.0)
+    assert warm[1] == pytest.approx(cold[1], rel=1e-3, abs=1.0)
+
+    # A useless guess falls back to the multi-start search
+    far = solve_bolt_icr(coords, Fx=5_500.0, Fy=-41_000.0, Mz=0.0, x_loc=300.0, y_loc=75.0, icr_guess=(1e5, 1e5))
+    assert far[0] == pytest.approx(cold[0])
+    assert far[1] == pytest.approx(cold[1])
+
+
+def test_icr_shear_batch_matches_per_load_analysis():
+    layout = BoltLayout.from_pattern(rows=3, cols=2, spacing_y=75.0, spacing_z=60.0)
+    bolt = BoltParams(diameter=20.0, grade="A325")
+    plate = Plate(corner_a=(-120.0, -60.0), corner_b=(120.0, 60.0), thickness=10.0, fu=450.0, fy=350.0)
+    conn = BoltConnection(layout=layout, bolt=bolt, plate=plate, n_shear_planes=1)
+
+    loads = [
+        Load(Fy=-50_000.0, location=(0.0, 0.0, 150.0)),
+        Load(Fy=-55_000.0, location=(0.0, 0.0, 160.0)),
+        Load(Fy=10_000.0, Fz=-5_000.0, Mx=1.0e6, location=(0.0, -30.0, 25.0)),
+    ]
+
+    fys, fzs = conn.icr_shear_batch(loads)
+    assert fys.shape == fzs.shape == (len(loads), layout.n)
+
+    for i, load in enumerate(loads):
+        forces = conn.analyze(load, shear_method="icr").to_bolt_force_array()
+        assert fys[i] == pytest.approx(forces.Fy, rel=1e-4, abs=1.0)
+        assert fzs[i] == pytest.approx(forces.Fz, rel=1e-4, abs=1.0)
+
+
+def test_bolt_force_array_is_read_only():
+    layout = BoltLayout.from_pattern(rows=2, cols=2, spacing_y=75.0, spacing_z=75.0)
+    bolt = BoltParams(diameter=20.0, grade="A325")
+    plate = Plate(corner_a=(-60.0, -60.0), corner_b=(60.0, 60.0), thickness=10.0, fu=450.0, fy=350.0)
+    conn = BoltConnection(layout=layout, bolt=bolt, plate=plate, n_shear_planes=1)
+    r = conn.analyze(Load(Fy=10000.0, location=(0.0, 0.0, 50.0)), shear_method="elastic")
+
+    arr = r.to_bolt_force_array()
+    for values in (arr.points, arr.Fx, arr.Fy, arr.Fz, arr.shear):
+        with pytest.raises(ValueError):
+            values[0] = 0.0
+    assert r.to_bolt_force_array().Fy[0] == r.bolt_forces["Fy"][0]
+    assert conn == BoltConnection(layout=layout, bolt=bolt, plate=plate, n_shear_planes=1)
+
+
+def test_icr_batch_accepts_scalar_loads():
+    import numpy as np
+
+    from connecty.bolt.solvers.icr import solve_bolt_icr, solve_bolt_icr_batch
+
+    coords = np.array([(0.0, 0.0), (0.0, 75.0), (80.0, 0.0), (80.0, 75.0)])
+    fxs, fys, icr = solve_bolt_icr_batch(coords, 0.0, -40_000.0, 0.0, 300.0, 40.0)
+    assert fxs.shape == fys.shape == (1, len(coords))
+    assert icr.shape == (1, 2)
+
+    fx, fy, _ = solve_bolt_icr(coords, 0.0, -40_000.0, 0.0, 300.0, 40.0)
+    assert fxs[0] == pytest.approx(fx)
+    assert fys[0] == pytest.approx(fy)
+
+
+def test_elastic_batch_accepts_scalar_loads():
+    import numpy as np
+
+    from connecty.bolt.solvers.elastic import solve_bolt_elastic, solve_bolt_elastic_batch
+
+    coords = np.array([(0.0, 0.0), (0.0, 75.0), (80.0, 0.0), (80.0, 75.0)])
+    fxs, fys = solve_bolt_elastic_batch(coords, 1000.0, 2000.0, 0.0, 0.0, 0.0)
+    assert fxs.shape == fys.shape == (1, len(coords))
+
+    fx, fy = solve_bolt_elastic(coords, 1000.0, 2000.0, 0.0, 0.0, 0.0)
+    assert fxs[0] == pytest.approx(fx)
+    assert fys[0] == pytest.approx(fy)
+
+
+def test_bolt_force_array_indexing_and_read_only_stresses():
+    import numpy as np
+
+    layout = BoltLayout.from_pattern(rows=2, cols=3, spacing_y=100.0, spacing_z=50.0)
+    bolt = BoltParams(diameter=20.0, grade="A325")
+    plate = Plate(corner_a=(-60.0, -60.0), corner_b=(60.0, 60.0), thickness=10.0, fu=450.0, fy=350.0)
+    conn = BoltConnection(layout=layout, bolt=bolt, plate=plate, n_shear_planes=1)
+    r = conn.analyze(Load(Fx=2000.0, Fy=10000.0, Mx=1.0e5, location=(0.0, 0.0, 0.0)), shear_method="elastic")
+
+    arr = r.to_bolt_force_array()
+    bf_list = r.to_bolt_forces()
+    assert arr[-1] == bf_list[-1]
+    assert arr[np.int64(2)] == bf_list[2]
+
+    head = arr[:2]
+    assert len(head) == 2
+    assert [head[i] for i in range(2)] == bf_list[:2]
+    picked = arr[np.array([-1, 0])]
+    assert list(picked.Fy) == [bf_list[-1].Fy, bf_list[0].Fy]
+
+    for values in (arr.shear_stress, arr.tension_stress, picked.Fx):
+        with pytest.raises(ValueError):
+            values[0] = 0.0
+
+
+def test_icr_eccentric_three_bolt_reaches_equilibrium():
+    import numpy as np
+
+    from connecty.bolt.solvers.icr import solve_bolt_icr
+
+    coords = np.array([(32.9089, -15.9176), (89.1668, -130.3583), (35.2457, 94.3457)])
+    Fx, Fy, Mz, x_loc, y_loc = -4955.0016, -19730.4029, -19_984_876.6047, -43.8082, 157.9789
+    fx, fy, _ = solve_bolt_icr(coords, Fx, Fy, Mz, x_loc, y_loc)
+
+    Cx, Cy = coords.mean(axis=0)
+    Mc = Mz + (x_loc - Cx) * Fy - (y_loc - Cy) * Fx
+    assert fx.sum() == pytest.approx(Fx, abs=1.0)
+    assert fy.sum() == pytest.approx(Fy, abs=1.0)
+    assert float((coords[:, 0] - Cx) @ fy - (coords[:, 1] - Cy) @ fx) == pytest.approx(Mc, rel=1e-4)
+
+
+def test_icr_pure_torsion_on_irregular_group_resists_full_moment():
+    import numpy as np
+
+    from connecty.bolt.solvers.icr import solve_bolt_icr
+
+    coords = np.array([
+        (-112.7, 51.2), (44.2, 34.6), (-34.9, 149.2), (144.3, 55.7), (45.1, 56.5), (-33.3, -109.5),
+    ])
+    Mz = 5.0e6
+    fx, fy, icr = solve_bolt_icr(coords, Fx=0.0, Fy=0.0, Mz=Mz, x_loc=0.0, y_loc=0.0)
+
+    Cx, Cy = coords.mean(axis=0)
+    assert float((coords[:, 0] - Cx) @ fy - (coords[:, 1] - Cy) @ fx) == pytest.approx(Mz, rel=1e-4)
+    assert fx.sum() == pytest.approx(0.0, abs=1.0)
+    assert fy.sum() == pytest.approx(0.0, abs=1.0)
+    assert np.hypot(icr[0] - Cx, icr[1] - Cy) < 200.0
@@ -0,0 +1,29 @@
+import numpy as np
+import pytest
+
+from connecty import Load
+
+
+def test_at_many_matches_scalar_at():
+    load = Load(Fx=1200.0, Fy=-3400.0, Fz=560.0, Mx=7.0e4, My=-2.0e4, Mz=3.0e4, location=(10.0, -25.0, 40.0))
+    pts = np.array([[0.0, 0.0, 0.0], [5.0, 12.5, -30.0], [-80.0, 60.0, 15.0]])
+
+    batched = load.at_many(pts)
+
+    assert batched.shape == (3, 6)
+    for row, (x, y, z) in zip(batched, pts):
+        assert row == pytest.approx(load.at(x=x, y=y, z=z))
+
+
+def test_equivalent_at_many_matches_per_load_at_many():
+    loads = [
+        Load(Fy=-1000.0, location=(0.0, 50.0, 0.0)),
+        Load(Fx=300.0, Fz=250.0, My=1.0e4, location=(5.0, 0.0, -20.0)),
+    ]
+    pts = np.array([[0.0, 0.0, 0.0], [0.0, 25.0, 75.0]])
+
+    batched = Load.equivalent_at_many(loads, pts)
+
+    assert batched.shape == (2, 2, 6)
+    for k, load in enumerate(loads):
+        assert batched[k] == pytest.approx(load.at_many(pts))